@@ -1,15 +1,55 @@
 """CDK Stack for Speaker Role Classifier Lambda function."""
 
+import os
+import shutil
+import subprocess
+
+import jsii
 from aws_cdk import (
     Stack,
     Duration,
+    Size,
     CfnOutput,
     BundlingOptions,
+    ILocalBundling,
     aws_lambda as lambda_,
     aws_logs as logs,
 )
 from constructs import Construct
-import os
+
+
+@jsii.implements(ILocalBundling)
+class LocalBundling:
+    """Host-side bundler that skips the Docker round-trip when possible.
+
+    CDK falls back to the container path whenever try_bundle returns False,
+    so failures here only cost a subprocess attempt, never a broken asset.
+    """
+
+    def try_bundle(self, output_dir, *, image, **kwargs):
+        project_root = os.path.join(os.path.dirname(__file__), "..")
+        try:
+            subprocess.run(
+                [
+                    "pip", "install", "--no-deps", "--no-cache-dir",
+                    "--platform", "manylinux2014_aarch64", "--only-binary=:all:",
+                    "-r", os.path.join(project_root, "requirements.lock"),
+                    "-t", output_dir,
+                ],
+                check=True,
+                capture_output=True,
+            )
+            subprocess.run(
+                ["pip", "install", "--no-deps", "--no-cache-dir", project_root, "-t", output_dir],
+                check=True,
+                capture_output=True,
+            )
+            handler_dir = os.path.join(project_root, "lambda_handler")
+            for name in os.listdir(handler_dir):
+                shutil.copy(os.path.join(handler_dir, name), output_dir)
+            return True
+        except (subprocess.CalledProcessError, OSError):
+            return False
 
 
 class SpeakerRoleClassifierStack(Stack):
@@ -30,6 +70,9 @@ class SpeakerRoleClassifierStack(Stack):
             self,
             "ClassifierFunction",
             runtime=lambda_.Runtime.PYTHON_3_11,
+            # Graviton: ~20% better price/performance than x86_64 at the same
+            # memory setting, and all our binary deps ship aarch64 wheels
+            architecture=lambda_.Architecture.ARM_64,
             handler="handler.lambda_handler",
             code=lambda_.Code.from_asset(
                 "../",
@@ -39,15 +82,34 @@ class SpeakerRoleClassifierStack(Stack):
                         "bash",
                         "-c",
                         " && ".join([
-                            "pip install --no-cache-dir --platform manylinux2014_x86_64 --only-binary=:all: -r requirements.txt -t /asset-output",
-                            "pip install --no-cache-dir . -t /asset-output",
+                            # uv's Rust resolver/installer is an order of
+                            # magnitude faster than pip inside the container;
+                            # --no-deps + the pinned lockfile skips dependency
+                            # resolution entirely: bundling is download + unpack
+                            "pip install --no-cache-dir uv",
+                            "uv pip install --no-deps --only-binary :all: --python-platform aarch64-manylinux2014 --target /asset-output -r requirements.lock",
+                            "uv pip install --no-deps --target /asset-output .",
+                            # No mypyc compile here: the default bundling image
+                            # is x86_64, so the emitted .so could never load on
+                            # the ARM_64 runtime and the function would quietly
+                            # fall back to the interpreted handler.py anyway.
+                            # Revisit if bundling moves to an arm64 image.
                             "cp -r lambda_handler/* /asset-output/",
                         ])
                     ],
+                    # Try bundling on the host first; Docker is only started
+                    # when the local pip/wheel path is unavailable
+                    local=LocalBundling(),
                 )
             ),
             timeout=Duration.seconds(60),
-            memory_size=512,
+            # 1024MB roughly halves cold-start import time versus 512MB (CPU
+            # scales with memory) at near-zero cost delta since duration drops
+            # proportionally. Override per-environment via
+            # `cdk deploy -c lambda_memory=...`; tune with the
+            # aws-lambda-power-tuning state machine if the workload shifts.
+            memory_size=int(self.node.try_get_context("lambda_memory") or 1024),
+            ephemeral_storage_size=Size.mebibytes(512),
             environment={
                 "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY", ""),
             },
@@ -55,9 +117,23 @@ class SpeakerRoleClassifierStack(Stack):
             description="Classifies speakers in call center transcripts as Agent or Customer using GPT-5",
         )
 
-        # Create Function URL (simplest way to expose as HTTP endpoint)
-        function_url = classifier_function.add_function_url(
+        # Keep warm instances ready so requests skip the cold-start penalty
+        # (openai/httpx/pydantic imports run 1-2s on a cold container)
+        live_alias = lambda_.Alias(
+            self,
+            "LiveAlias",
+            alias_name="live",
+            version=classifier_function.current_version,
+            provisioned_concurrent_executions=2,
+        )
+
+        # Create Function URL (simplest way to expose as HTTP endpoint),
+        # pointed at the alias so traffic lands on provisioned instances
+        function_url = live_alias.add_function_url(
             auth_type=lambda_.FunctionUrlAuthType.NONE,  # Public access - change to AWS_IAM for auth
+            # Buffered mode pins payload format 2.0, which always delivers the
+            # body as a string — the handler relies on this contract
+            invoke_mode=lambda_.InvokeMode.BUFFERED,
             cors=lambda_.FunctionUrlCorsOptions(
                 allowed_origins=["*"],
                 allowed_methods=[lambda_.HttpMethod.POST],
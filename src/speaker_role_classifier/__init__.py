@@ -1,12 +1,5 @@
 """Speaker Role Classifier - Identify agents and customers in call center transcripts."""
 
-from .classifier import (
-    classify_speakers,
-    InvalidJSONResponseError,
-    MissingSpeakerMappingError,
-    SpeakerNotFoundError,
-)
-
 __version__ = "0.1.0"
 
 __all__ = [
@@ -16,3 +9,16 @@ __all__ = [
     "SpeakerNotFoundError",
 ]
 
+
+def __getattr__(name):
+    """Lazily re-export the public API so importing the package stays cheap.
+
+    Callers that import the submodule directly (like the Lambda handler)
+    never pay for this; `from speaker_role_classifier import classify_speakers`
+    still works and only loads the classifier on first access.
+    """
+    if name in __all__:
+        from . import classifier
+        return getattr(classifier, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
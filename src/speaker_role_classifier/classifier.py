@@ -1,15 +1,155 @@
 """Core speaker classification logic."""
 
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import io
 import os
 import json
+import random
 import re
-from typing import Dict, List, Optional
-from openai import OpenAI
-from dotenv import load_dotenv
+import sys
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from openai import OpenAI, AsyncOpenAI
+
+from .safeguard import run_safeguard_validation, run_safeguard_validation_async
+
+try:
+    # orjson decodes the small mapping dicts ~2-3x faster than stdlib json;
+    # its JSONDecodeError subclasses json.JSONDecodeError, so the existing
+    # except clauses cover both decoders
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - optional speedup
+    _loads = json.loads
+
+
+def __getattr__(name: str):
+    """Import the OpenAI SDK lazily on first attribute access (PEP 562).
+
+    The SDK drags in pydantic and the httpx stack, so deferring it keeps
+    `speaker-role-classifier --help` and other no-API paths fast while still
+    exposing OpenAI/AsyncOpenAI as patchable module attributes.
+    """
+    if name in ('OpenAI', 'AsyncOpenAI'):
+        from openai import OpenAI, AsyncOpenAI
+        globals()['OpenAI'] = OpenAI
+        globals()['AsyncOpenAI'] = AsyncOpenAI
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=1)
+def _load_env() -> None:
+    """Load .env once, deferred until a real client is constructed."""
+    from dotenv import load_dotenv
+    load_dotenv()
+
+# Compiled once at import so warm invocations skip recompilation; multiline
+# so label extraction is a single C-level scan over the whole transcript
+_LABEL_PATTERN = re.compile(r'(?m)^[ \t]*([^:\n]+?)[ \t]*:')
+
+# Module-level client cache so warm Lambda containers reuse the TLS session
+_client: Optional[OpenAI] = None
+_async_client: Optional[AsyncOpenAI] = None
+
+
+def _http_client_kwargs(async_client: bool) -> Dict:
+    """Build kwargs for a keep-alive-tuned httpx transport.
+
+    A generous keep-alive pool lets batch/CLI pipelines reuse warm
+    connections instead of paying a TCP/TLS handshake per transcript; the
+    long read timeout matches the OpenAI SDK default for slow completions.
+    Returns no kwargs when httpx is unavailable so the SDK manages its own
+    transport.
+    """
+    try:
+        import httpx
+    except ImportError:  # pragma: no cover - fall back to SDK-managed transport
+        return {}
+    limits = httpx.Limits(max_keepalive_connections=32)
+    timeout = httpx.Timeout(600.0, connect=5.0)
+    if async_client:
+        return {'http_client': httpx.AsyncClient(limits=limits, timeout=timeout)}
+    return {'http_client': httpx.Client(limits=limits, timeout=timeout)}
+
+# Content-addressed mapping cache: repeated transcripts skip the API entirely
+_MAPPING_CACHE_MAX = 1024
+_mapping_cache: 'OrderedDict[tuple, Dict[str, str]]' = OrderedDict()
+
+
+# Transient API failures are retried with capped exponential backoff so a
+# rate-limit blip or dropped connection doesn't abort a whole batch run
+_RETRY_ATTEMPTS = 5
+_RETRY_BASE_DELAY = 1.0
+_RETRY_MAX_DELAY = 16.0
+
+
+def _is_retryable_error(error: Exception) -> bool:
+    """Whether an API error is transient (rate limit, timeout, connection).
+
+    Resolves the exception types through sys.modules so the lazy openai
+    import stays deferred; if the SDK was never imported, nothing it could
+    have raised is in flight.
+    """
+    openai_mod = sys.modules.get('openai')
+    if openai_mod is None:
+        return False
+    return isinstance(error, (
+        openai_mod.RateLimitError,
+        openai_mod.APITimeoutError,
+        openai_mod.APIConnectionError,
+    ))
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with jitter, capped at _RETRY_MAX_DELAY seconds."""
+    # Jitter only spreads retries out; it carries no security weight
+    return min(_RETRY_BASE_DELAY * (2 ** attempt), _RETRY_MAX_DELAY) * random.uniform(0.5, 1.0)  # nosec B311
+
+
+def _transcript_fingerprint(transcript: str) -> str:
+    """Hash a whitespace-normalized transcript into a short stable digest."""
+    normalized = ' '.join(transcript.split())
+    return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
 
-from .safeguard import run_safeguard_validation
 
-load_dotenv()
+def _get_client() -> OpenAI:
+    """Return a cached OpenAI client, constructing it on first use."""
+    global _client
+    if _client is None:
+        _load_env()
+        api_key = os.getenv('OPENAI_API_KEY')
+        if not api_key:
+            raise ValueError("OPENAI_API_KEY environment variable is not set")
+        # Read the class via globals() so test doubles patched onto this
+        # module are honored; fall back to the lazy import on first use
+        openai_cls = globals().get('OpenAI')
+        if openai_cls is None:
+            openai_cls = __getattr__('OpenAI')
+        _client = openai_cls(api_key=api_key, **_http_client_kwargs(async_client=False))
+    return _client
+
+
+def _get_async_client() -> AsyncOpenAI:
+    """Return a cached AsyncOpenAI client, constructing it on first use."""
+    global _async_client
+    if _async_client is None:
+        _load_env()
+        api_key = os.getenv('OPENAI_API_KEY')
+        if not api_key:
+            raise ValueError("OPENAI_API_KEY environment variable is not set")
+        openai_cls = globals().get('AsyncOpenAI')
+        if openai_cls is None:
+            openai_cls = __getattr__('AsyncOpenAI')
+        _async_client = openai_cls(api_key=api_key, **_http_client_kwargs(async_client=True))
+    return _async_client
 
 
 # Custom exceptions
@@ -29,121 +169,366 @@ class SpeakerNotFoundError(Exception):
 
 
 def _extract_speaker_labels(transcript: str) -> set:
-    """Extract all unique speaker labels from transcript."""
-    label_pattern = r'^([^:]+):'
+    """Extract all unique speaker labels from transcript.
+
+    Scans with str.find/str.strip (memchr-backed C loops) instead of the
+    regex engine, so multi-MB transcripts are walked without per-character
+    lazy-quantifier stepping.
+    """
     labels = set()
-    
-    for line in transcript.split('\n'):
-        line = line.strip()
-        if not line:
-            continue
-        match = re.match(label_pattern, line)
-        if match:
-            labels.add(match.group(1).strip())
-    
+    pos = 0
+    n = len(transcript)
+    while pos < n:
+        eol = transcript.find('\n', pos)
+        if eol == -1:
+            eol = n
+        colon = transcript.find(':', pos, eol)
+        if colon != -1:
+            label = transcript[pos:colon].strip(' \t')
+            if label:
+                labels.add(label)
+        pos = eol + 1
     return labels
 
 
-def _identify_non_target_labels(transcript: str, target_roles: List[str]) -> set:
-    """Identify speaker labels that are not in the target roles list."""
-    all_labels = _extract_speaker_labels(transcript)
+def _identify_non_target_labels(transcript: str, target_roles: List[str], all_labels: Optional[set] = None) -> set:
+    """Identify speaker labels that are not in the target roles list.
+
+    Pass a precomputed all_labels set to avoid rescanning the transcript.
+    """
+    if all_labels is None:
+        all_labels = _extract_speaker_labels(transcript)
     non_target = {label for label in all_labels if label not in target_roles}
     return non_target
 
 
-def _call_gpt5_api(transcript: str, target_roles: List[str], labels_to_map: set, log: List[Dict]) -> Dict[str, str]:
+def _trivial_mapping(all_labels: set, non_target_labels: set, target_roles: List[str]) -> Optional[Dict[str, str]]:
+    """Resolve the mapping by pigeonhole when only one assignment is possible.
+
+    If exactly one label needs mapping and exactly one target role is not
+    already present in the transcript, the answer is forced and the API
+    round-trip can be skipped entirely.
+    """
+    if len(non_target_labels) != 1:
+        return None
+    remaining_roles = [r for r in target_roles if r not in all_labels]
+    if len(remaining_roles) != 1:
+        return None
+    return {next(iter(non_target_labels)): remaining_roles[0]}
+
+
+def _summarize_for_mapping(transcript: str, head_turns: int = 6, tail_turns: int = 2) -> str:
+    """Build a compact head+tail sample of the transcript for the mapping prompt.
+
+    Role identity is almost always determinable from the opening turns
+    (greeting, company self-identification), so sending the whole transcript
+    just to decide labels wastes input tokens and latency. Keeps the first
+    head_turns and last tail_turns utterances per speaker, in original order,
+    so every speaker stays represented; the full transcript is still used for
+    label replacement.
+    """
+    lines = transcript.split('\n')
+    labeled = [
+        (i, match.group(1)) for i, line in enumerate(lines)
+        if (match := _LABEL_PATTERN.match(line))
+    ]
+
+    keep = set()
+    head_counts: Dict[str, int] = {}
+    for i, label in labeled:
+        if head_counts.get(label, 0) < head_turns:
+            head_counts[label] = head_counts.get(label, 0) + 1
+            keep.add(i)
+    tail_counts: Dict[str, int] = {}
+    for i, label in reversed(labeled):
+        if tail_counts.get(label, 0) < tail_turns:
+            tail_counts[label] = tail_counts.get(label, 0) + 1
+            keep.add(i)
+
+    if len(keep) == len(labeled):
+        return transcript
+    return '\n'.join(lines[i] for i in sorted(keep))
+
+
+def _mapping_token_budget(labels_to_map: set) -> int:
+    """Upper-bound the completion tokens needed for a mapping response.
+
+    The expected output is a flat JSON object with one key per label, so a
+    small per-label allowance plus fixed overhead caps worst-case decode
+    time without ever truncating a well-formed mapping.
+    """
+    return 32 + 24 * len(labels_to_map)
+
+
+@lru_cache(maxsize=32)
+def _prompt_fragments(roles: tuple) -> tuple:
+    """Precompute the invariant prompt pieces for a target-roles tuple.
+
+    The system message and the instruction prefix only depend on the roles,
+    so they are built (and their joins paid) once per roles tuple instead of
+    on every API call.
+    """
+    role_desc = " and ".join(roles)
+
+    system = f"You are a conversation transcript analyzer. Always respond with valid JSON mapping speaker labels to these roles: {role_desc}"
+
+    prefix = f"""You are analyzing a conversation transcript. Your task is to identify which speaker has which role.
+
+The valid roles are: {role_desc}
+
+Analyze the conversation and determine which speaker label corresponds to which role.
+
+Respond with a JSON object mapping each speaker label to their role. Use exactly the role names provided: {', '.join(f'"{r}"' for r in roles)}
+
+Example format:
+{{
+  "Speaker 0": "{roles[0]}",
+  "Speaker 1": "{roles[1]}"
+}}"""
+
+    return system, prefix
+
+
+def _build_mapping_messages(transcript: str, target_roles: List[str], labels_to_map: set) -> List[Dict[str, str]]:
+    """Build the chat messages asking GPT-5 to map speaker labels to roles.
+
+    The instruction block is ordered ahead of the transcript so every call
+    with the same target roles shares a byte-identical prompt prefix, which
+    OpenAI's server-side prompt cache can reuse across transcripts.
+    """
+    system, prefix = _prompt_fragments(tuple(target_roles))
+    labels_str = ', '.join(sorted(labels_to_map))
+
+    prompt = f"""{prefix}
+
+Here is the transcript:
+
+{transcript}
+
+The following speaker labels need to be mapped to roles: {labels_str}"""
+
+    return [
+        {"role": "system", "content": system},
+        {"role": "user", "content": prompt}
+    ]
+
+
+def _collect_stream_content(response) -> Optional[str]:
+    """
+    Accumulate streamed completion deltas, stopping at the end of the mapping.
+
+    Tracks brace depth so we can close the stream as soon as the top-level
+    JSON object is complete instead of waiting for the final chunk. Whole
+    (non-streamed) responses are passed through untouched for callers and
+    test doubles that ignore stream=True.
+    """
+    choices = getattr(response, 'choices', None)
+    if choices:
+        return choices[0].message.content
+
+    parts = []
+    depth = 0
+    started = False
+    for chunk in response:
+        delta = chunk.choices[0].delta.content
+        if not delta:
+            continue
+        parts.append(delta)
+        for char in delta:
+            if char == '{':
+                depth += 1
+                started = True
+            elif char == '}':
+                depth -= 1
+        if started and depth == 0:
+            break
+
+    close = getattr(response, 'close', None)
+    if close is not None:
+        close()
+
+    return ''.join(parts)
+
+
+def _record_mapping(content: Optional[str], cache_key: tuple, log: List[Dict]) -> Dict[str, str]:
+    """Parse, log, and cache a mapping response body."""
+    if not content:
+        raise InvalidJSONResponseError("API returned empty response")
+
+    mapping = _loads(content)
+
+    log.append({
+        'step': 'mapping_decision',
+        'mapping': mapping
+    })
+
+    _mapping_cache[cache_key] = dict(mapping)
+    if len(_mapping_cache) > _MAPPING_CACHE_MAX:
+        _mapping_cache.popitem(last=False)
+
+    return mapping
+
+
+def _call_gpt5_api(transcript: str, target_roles: List[str], labels_to_map: set, log: List[Dict], client: Optional[OpenAI] = None) -> Dict[str, str]:
     """
     Call GPT-5 API to map speaker labels to target roles.
-    
+
     Args:
         transcript: The transcript to analyze
         target_roles: List of target role names
         labels_to_map: Set of labels that need to be mapped
         log: Log list to append to
-        
+        client: OpenAI client to use (default: cached module-level client)
+
     Returns:
         Dictionary mapping speaker labels to target roles
     """
-    api_key = os.getenv('OPENAI_API_KEY')
-    if not api_key:
-        raise ValueError("OPENAI_API_KEY environment variable is not set")
-    
-    client = OpenAI(api_key=api_key)
-    
-    role_desc = " and ".join(target_roles)
-    labels_str = ', '.join(sorted(labels_to_map))
+    fingerprint = _transcript_fingerprint(transcript)
+    cache_key = (fingerprint, tuple(target_roles), frozenset(labels_to_map))
+    cached = _mapping_cache.get(cache_key)
+    if cached is not None:
+        _mapping_cache.move_to_end(cache_key)
+        log.append({
+            'step': 'cache_hit',
+            'target_roles': target_roles,
+            'mapping': cached
+        })
+        return dict(cached)
+
+    if client is None:
+        client = _get_client()
+
+    messages = _build_mapping_messages(
+        _summarize_for_mapping(transcript), target_roles, labels_to_map
+    )
+
+    log.append({
+        'step': 'mapping_request',
+        'target_roles': target_roles,
+        'labels_to_map': sorted(labels_to_map)
+    })
     
-    prompt = f"""You are analyzing a conversation transcript. Your task is to identify which speaker has which role.
+    for attempt in range(_RETRY_ATTEMPTS):
+        try:
+            try:
+                # Stream so parsing can finish as soon as the closing brace
+                # arrives, instead of waiting out the response tail
+                response = client.chat.completions.create(
+                    model="gpt-5",
+                    messages=messages,
+                    response_format={"type": "json_object"},
+                    max_completion_tokens=_mapping_token_budget(labels_to_map),
+                    # Opt into server-side prompt caching for repeated prefixes
+                    extra_body={"prompt_cache_key": fingerprint},
+                    stream=True,
+                )
+            except TypeError:
+                # Client doesn't accept stream here; fall back to a whole response
+                response = client.chat.completions.create(
+                    model="gpt-5",
+                    messages=messages,
+                    response_format={"type": "json_object"},
+                    max_completion_tokens=_mapping_token_budget(labels_to_map),
+                    extra_body={"prompt_cache_key": fingerprint},
+                )
 
-The valid roles are: {role_desc}
+            return _record_mapping(_collect_stream_content(response), cache_key, log)
 
-Here is the transcript:
+        except json.JSONDecodeError as e:
+            log.append({'step': 'error', 'error': f"JSON decode error: {str(e)}"})
+            raise InvalidJSONResponseError(f"Failed to parse JSON response from API: {e}")
+        except Exception as e:
+            if _is_retryable_error(e) and attempt < _RETRY_ATTEMPTS - 1:
+                delay = _retry_delay(attempt)
+                log.append({
+                    'step': 'retry',
+                    'attempt': attempt + 1,
+                    'delay': round(delay, 2),
+                    'error': str(e)
+                })
+                time.sleep(delay)
+                continue
+            log.append({'step': 'error', 'error': str(e)})
+            if isinstance(e, InvalidJSONResponseError):
+                raise
+            raise InvalidJSONResponseError(f"API call failed: {e}")
 
-{transcript}
 
-The following speaker labels need to be mapped to roles: {labels_str}
+async def _call_gpt5_api_async(transcript: str, target_roles: List[str], labels_to_map: set, log: List[Dict], client: Optional[AsyncOpenAI] = None) -> Dict[str, str]:
+    """Async counterpart of _call_gpt5_api, used to fan out over many transcripts."""
+    fingerprint = _transcript_fingerprint(transcript)
+    cache_key = (fingerprint, tuple(target_roles), frozenset(labels_to_map))
+    cached = _mapping_cache.get(cache_key)
+    if cached is not None:
+        _mapping_cache.move_to_end(cache_key)
+        log.append({
+            'step': 'cache_hit',
+            'target_roles': target_roles,
+            'mapping': cached
+        })
+        return dict(cached)
 
-Analyze the conversation and determine which speaker label corresponds to which role.
+    if client is None:
+        client = _get_async_client()
 
-Respond with a JSON object mapping each speaker label to their role. Use exactly the role names provided: {', '.join(f'"{r}"' for r in target_roles)}
+    messages = _build_mapping_messages(
+        _summarize_for_mapping(transcript), target_roles, labels_to_map
+    )
 
-Example format:
-{{
-  "Speaker 0": "{target_roles[0]}",
-  "Speaker 1": "{target_roles[1]}"
-}}"""
-    
     log.append({
         'step': 'mapping_request',
         'target_roles': target_roles,
-        'labels_to_map': list(labels_to_map)
+        'labels_to_map': sorted(labels_to_map)
     })
-    
-    try:
-        response = client.chat.completions.create(
-            model="gpt-5",
-            messages=[
-                {"role": "system", "content": f"You are a conversation transcript analyzer. Always respond with valid JSON mapping speaker labels to these roles: {role_desc}"},
-                {"role": "user", "content": prompt}
-            ],
-            response_format={"type": "json_object"},
-        )
-        
-        content = response.choices[0].message.content
-        if not content:
-            raise InvalidJSONResponseError("API returned empty response")
-        
-        mapping = json.loads(content)
-        
-        log.append({
-            'step': 'mapping_decision',
-            'mapping': mapping
-        })
-        
-        return mapping
-        
-    except json.JSONDecodeError as e:
-        log.append({'step': 'error', 'error': f"JSON decode error: {str(e)}"})
-        raise InvalidJSONResponseError(f"Failed to parse JSON response from API: {e}")
-    except Exception as e:
-        log.append({'step': 'error', 'error': str(e)})
-        if isinstance(e, InvalidJSONResponseError):
-            raise
-        raise InvalidJSONResponseError(f"API call failed: {e}")
-
-
-def _validate_mapping(transcript: str, mapping: Dict[str, str], target_roles: List[str]) -> None:
-    """Validate that the speaker mapping is complete and correct."""
-    non_target_labels = _identify_non_target_labels(transcript, target_roles)
+
+    for attempt in range(_RETRY_ATTEMPTS):
+        try:
+            response = await client.chat.completions.create(
+                model="gpt-5",
+                messages=messages,
+                response_format={"type": "json_object"},
+                max_completion_tokens=_mapping_token_budget(labels_to_map),
+                extra_body={"prompt_cache_key": fingerprint},
+            )
+
+            return _record_mapping(response.choices[0].message.content, cache_key, log)
+
+        except json.JSONDecodeError as e:
+            log.append({'step': 'error', 'error': f"JSON decode error: {str(e)}"})
+            raise InvalidJSONResponseError(f"Failed to parse JSON response from API: {e}")
+        except Exception as e:
+            if _is_retryable_error(e) and attempt < _RETRY_ATTEMPTS - 1:
+                delay = _retry_delay(attempt)
+                log.append({
+                    'step': 'retry',
+                    'attempt': attempt + 1,
+                    'delay': round(delay, 2),
+                    'error': str(e)
+                })
+                await asyncio.sleep(delay)
+                continue
+            log.append({'step': 'error', 'error': str(e)})
+            if isinstance(e, InvalidJSONResponseError):
+                raise
+            raise InvalidJSONResponseError(f"API call failed: {e}")
+
+
+def _validate_mapping(transcript: str, mapping: Dict[str, str], target_roles: List[str], all_labels: Optional[set] = None) -> None:
+    """Validate that the speaker mapping is complete and correct.
+
+    Pass a precomputed all_labels set to avoid rescanning the transcript.
+    """
+    if all_labels is None:
+        all_labels = _extract_speaker_labels(transcript)
+    non_target_labels = _identify_non_target_labels(transcript, target_roles, all_labels)
     speakers_in_mapping = set(mapping.keys())
-    
+
     unmapped_speakers = non_target_labels - speakers_in_mapping
     if unmapped_speakers:
         raise MissingSpeakerMappingError(
             f"Not all speakers are mapped. Missing: {', '.join(sorted(unmapped_speakers))}"
         )
-    
-    all_labels = _extract_speaker_labels(transcript)
+
     extra_speakers = speakers_in_mapping - all_labels
     if extra_speakers:
         raise SpeakerNotFoundError(
@@ -151,25 +536,43 @@ def _validate_mapping(transcript: str, mapping: Dict[str, str], target_roles: Li
         )
 
 
+# Compiled replacement patterns keyed by label set; diarizer output labels
+# repeat across transcripts (Speaker 0/1/...), so reruns skip recompilation
+_REPLACE_PATTERN_CACHE_MAX = 128
+_replace_pattern_cache: Dict[frozenset, 're.Pattern'] = {}
+
+
 def _replace_speakers(transcript: str, mapping: Dict[str, str], log: List[Dict]) -> str:
     """Replace speaker labels with roles in the transcript."""
-    result = transcript
-    replacements_made = []
-    
-    for speaker_label in sorted(mapping.keys(), reverse=True):
-        role = mapping[speaker_label]
-        old_pattern = f"{speaker_label}:"
-        new_pattern = f"{role}:"
-        
-        if old_pattern in result:
-            count = result.count(old_pattern)
-            result = result.replace(old_pattern, new_pattern)
-            replacements_made.append({
-                'from': speaker_label,
-                'to': role,
-                'occurrences': count
-            })
-    
+    # One alternation pattern replaces every label in a single pass instead
+    # of one count + replace scan per label; occurrence tallies are collected
+    # as a side effect of the substitution callback
+    labels = sorted(mapping.keys(), reverse=True)
+    pattern_key = frozenset(labels)
+    pattern = _replace_pattern_cache.get(pattern_key)
+    if pattern is None:
+        pattern = re.compile('(' + '|'.join(re.escape(label) for label in labels) + '):')
+        if len(_replace_pattern_cache) < _REPLACE_PATTERN_CACHE_MAX:
+            _replace_pattern_cache[pattern_key] = pattern
+    counts: Dict[str, int] = {}
+
+    def substitute(match):
+        label = match.group(1)
+        counts[label] = counts.get(label, 0) + 1
+        return mapping[label] + ':'
+
+    result = pattern.sub(substitute, transcript)
+
+    replacements_made = [
+        {
+            'from': label,
+            'to': mapping[label],
+            'occurrences': counts[label]
+        }
+        for label in labels
+        if label in counts
+    ]
+
     log.append({
         'step': 'label_replacement',
         'replacements': replacements_made
@@ -181,16 +584,18 @@ def _replace_speakers(transcript: str, mapping: Dict[str, str], log: List[Dict])
 def classify_speakers(
     transcript: str,
     target_roles: Optional[List[str]] = None,
-    enable_safeguard: bool = False
+    enable_safeguard: bool = False,
+    client: Optional[OpenAI] = None
 ) -> Dict:
     """
     Classify speakers in a transcript with configurable roles and logging.
-    
+
     Args:
         transcript: The transcript to classify
         target_roles: List of target role names (default: ["Agent", "Customer"])
         enable_safeguard: Whether to run validation safeguard (default: False)
-        
+        client: OpenAI client to reuse across calls (default: cached module-level client)
+
     Returns:
         Dict with 'transcript' (classified text) and 'log' (list of log entries)
     """
@@ -205,20 +610,27 @@ def classify_speakers(
         'enable_safeguard': enable_safeguard
     })
     
-    non_target_labels = _identify_non_target_labels(transcript, target_roles)
-    
+    all_labels = _extract_speaker_labels(transcript)
+    non_target_labels = _identify_non_target_labels(transcript, target_roles, all_labels)
+
+    # Sort once and log the same lists instead of materializing each set
+    # twice; also makes log output deterministic
     log.append({
         'step': 'label_analysis',
-        'all_labels': list(_extract_speaker_labels(transcript)),
+        'all_labels': sorted(all_labels),
         'target_roles': target_roles,
-        'non_target_labels': list(non_target_labels)
+        'non_target_labels': sorted(non_target_labels)
     })
     
     result_transcript = transcript
     
     if non_target_labels:
-        mapping = _call_gpt5_api(transcript, target_roles, non_target_labels, log)
-        _validate_mapping(transcript, mapping, target_roles)
+        mapping = _trivial_mapping(all_labels, non_target_labels, target_roles)
+        if mapping is not None:
+            log.append({'step': 'trivial_mapping', 'mapping': mapping})
+        else:
+            mapping = _call_gpt5_api(transcript, target_roles, non_target_labels, log, client=client)
+        _validate_mapping(transcript, mapping, target_roles, all_labels)
         result_transcript = _replace_speakers(transcript, mapping, log)
     
     if enable_safeguard:
@@ -231,3 +643,224 @@ def classify_speakers(
         'transcript': result_transcript,
         'log': log
     }
+
+
+async def classify_speakers_many(
+    transcripts: List[str],
+    target_roles: Optional[List[str]] = None,
+    enable_safeguard: bool = False,
+    concurrency: Optional[int] = None,
+    client: Optional[AsyncOpenAI] = None
+) -> List[Dict]:
+    """
+    Classify many transcripts concurrently with the async OpenAI client.
+
+    Overlaps the network-bound API round-trips, so wall time collapses from
+    N * RTT to roughly ceil(N / concurrency) * RTT.
+
+    Args:
+        transcripts: List of transcripts to classify
+        target_roles: List of target role names (default: ["Agent", "Customer"])
+        enable_safeguard: Whether to run validation safeguard per transcript (default: False)
+        concurrency: Max in-flight API calls (default: SRC_CONCURRENCY env or 16)
+        client: AsyncOpenAI client to use (default: cached module-level client)
+
+    Returns:
+        List of dicts with 'transcript' and 'log', one per input transcript
+    """
+    if target_roles is None:
+        target_roles = ["Agent", "Customer"]
+    if concurrency is None:
+        concurrency = int(os.getenv("SRC_CONCURRENCY", "16"))
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def classify_one(transcript: str) -> Dict:
+        log: List[Dict] = [{
+            'step': 'configuration',
+            'target_roles': target_roles,
+            'enable_safeguard': enable_safeguard
+        }]
+
+        all_labels = _extract_speaker_labels(transcript)
+        non_target_labels = _identify_non_target_labels(transcript, target_roles, all_labels)
+
+        log.append({
+            'step': 'label_analysis',
+            'all_labels': sorted(all_labels),
+            'target_roles': target_roles,
+            'non_target_labels': sorted(non_target_labels)
+        })
+
+        result_transcript = transcript
+
+        if non_target_labels:
+            mapping = _trivial_mapping(all_labels, non_target_labels, target_roles)
+            if mapping is not None:
+                log.append({'step': 'trivial_mapping', 'mapping': mapping})
+            else:
+                async with semaphore:
+                    mapping = await _call_gpt5_api_async(
+                        transcript, target_roles, non_target_labels, log, client=client
+                    )
+            _validate_mapping(transcript, mapping, target_roles, all_labels)
+            result_transcript = _replace_speakers(transcript, mapping, log)
+
+        if enable_safeguard:
+            # The safeguard makes its own API round-trips, so it shares the
+            # semaphore with the classification calls to keep the in-flight
+            # request count bounded by the same limit
+            async with semaphore:
+                result_transcript = await run_safeguard_validation_async(
+                    result_transcript,
+                    target_roles,
+                    log
+                )
+
+        return {
+            'transcript': result_transcript,
+            'log': log
+        }
+
+    return list(await asyncio.gather(*(classify_one(t) for t in transcripts)))
+
+
+def submit_batch_classification(
+    transcripts: List[str],
+    target_roles: Optional[List[str]] = None,
+    client: Optional[OpenAI] = None
+) -> str:
+    """
+    Submit transcripts to the OpenAI Batch API for deferred classification.
+
+    The Batch API runs the same model at half the cost with an up-to-24h
+    completion window, which suits bulk/overnight transcript analysis.
+
+    Args:
+        transcripts: List of transcripts to classify
+        target_roles: List of target role names (default: ["Agent", "Customer"])
+        client: OpenAI client to use (default: cached module-level client)
+
+    Returns:
+        The batch job id to poll with retrieve_batch_classification
+    """
+    if target_roles is None:
+        target_roles = ["Agent", "Customer"]
+    if client is None:
+        client = _get_client()
+
+    lines = []
+    for i, transcript in enumerate(transcripts):
+        labels_to_map = _identify_non_target_labels(transcript, target_roles)
+        lines.append(json.dumps({
+            "custom_id": f"t{i}",
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": "gpt-5",
+                "messages": _build_mapping_messages(transcript, target_roles, labels_to_map),
+                "response_format": {"type": "json_object"},
+                "max_completion_tokens": _mapping_token_budget(labels_to_map),
+            },
+        }))
+
+    input_file = client.files.create(
+        file=io.BytesIO('\n'.join(lines).encode('utf-8')),
+        purpose="batch",
+    )
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    return batch.id
+
+
+def classify_speakers_batch(
+    transcripts: List[str],
+    target_roles: Optional[List[str]] = None,
+    client: Optional[OpenAI] = None,
+    poll_interval: float = 30.0,
+    timeout: float = 86400.0
+) -> List[Dict]:
+    """
+    Classify many transcripts through the OpenAI Batch API, blocking until done.
+
+    Submits one batch job (50% of synchronous cost, separate rate-limit pool),
+    polls until it completes, then validates and applies each mapping locally.
+
+    Args:
+        transcripts: List of transcripts to classify
+        target_roles: List of target role names (default: ["Agent", "Customer"])
+        client: OpenAI client to use (default: cached module-level client)
+        poll_interval: Seconds between status polls (default: 30)
+        timeout: Seconds to wait before giving up (default: 24h, the batch SLA)
+
+    Returns:
+        List of dicts with 'transcript' and 'log', one per input transcript
+    """
+    if target_roles is None:
+        target_roles = ["Agent", "Customer"]
+    if client is None:
+        client = _get_client()
+
+    batch_id = submit_batch_classification(transcripts, target_roles, client=client)
+
+    deadline = time.monotonic() + timeout
+    while True:
+        status = retrieve_batch_classification(batch_id, client=client)
+        if status['status'] == 'completed':
+            break
+        if status['status'] in ('failed', 'expired', 'cancelled'):
+            raise InvalidJSONResponseError(f"Batch {batch_id} ended with status: {status['status']}")
+        if time.monotonic() > deadline:
+            raise InvalidJSONResponseError(f"Batch {batch_id} did not complete within {timeout} seconds")
+        time.sleep(poll_interval)
+
+    mappings = status.get('mappings', {})
+    results = []
+    for i, transcript in enumerate(transcripts):
+        log: List[Dict] = [{
+            'step': 'batch_result',
+            'batch_id': batch_id,
+            'custom_id': f"t{i}",
+            'target_roles': target_roles
+        }]
+        mapping = mappings.get(f"t{i}")
+        result_transcript = transcript
+        if mapping:
+            _validate_mapping(transcript, mapping, target_roles)
+            result_transcript = _replace_speakers(transcript, mapping, log)
+        results.append({'transcript': result_transcript, 'log': log})
+    return results
+
+
+def retrieve_batch_classification(batch_id: str, client: Optional[OpenAI] = None) -> Dict:
+    """
+    Retrieve the status (and, when complete, the results) of a batch job.
+
+    Args:
+        batch_id: The id returned by submit_batch_classification
+        client: OpenAI client to use (default: cached module-level client)
+
+    Returns:
+        Dict with 'status' and, when completed, 'mappings' keyed by custom_id
+    """
+    if client is None:
+        client = _get_client()
+
+    batch = client.batches.retrieve(batch_id)
+    result: Dict = {'status': batch.status}
+
+    if batch.status == "completed" and batch.output_file_id:
+        output = client.files.content(batch.output_file_id)
+        mappings = {}
+        for line in output.text.strip().split('\n'):
+            if not line:
+                continue
+            record = _loads(line)
+            content = record['response']['body']['choices'][0]['message']['content']
+            mappings[record['custom_id']] = _loads(content)
+        result['mappings'] = mappings
+
+    return result
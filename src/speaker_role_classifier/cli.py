@@ -1,38 +1,121 @@
+import asyncio
+import os
+
 import click
-from .classifier import classify_speakers
+from .classifier import classify_speakers, classify_speakers_batch, classify_speakers_many
 
 @click.command()
-@click.argument('input_file', type=click.File('r'))
-@click.argument('output_file', type=click.File('w'))
+@click.argument('input_path', type=click.Path(exists=True, allow_dash=True))
+@click.argument('output_path', type=click.Path(allow_dash=True))
 @click.option('--target-roles', multiple=True, help='Target role names (e.g., --target-roles Sales --target-roles Lead)')
 @click.option('--safeguard/--no-safeguard', default=False, help='Enable safeguard validation layer to check for misclassifications.')
-def main(input_file, output_file, target_roles, safeguard):
-    """Classify speaker roles in a transcript."""
-    transcript = input_file.read()
+@click.option('--batch', is_flag=True, default=False, help='Process a directory of .txt transcripts through the OpenAI Batch API (50% cost, up to 24h turnaround).')
+def main(input_path, output_path, target_roles, safeguard, batch):
+    """Classify speaker roles in a transcript file, or a directory of them with --batch."""
+    # Convert target_roles tuple to list if provided
+    roles_list = list(target_roles) if target_roles else None
+
     try:
-        # Convert target_roles tuple to list if provided
-        roles_list = list(target_roles) if target_roles else None
-        
+        if batch:
+            if safeguard:
+                # The Batch API is fire-and-forget; the safeguard's iterative
+                # tool-call loop cannot run inside it
+                click.echo("Error: --safeguard is not supported with --batch", err=True)
+                return
+            if not os.path.isdir(input_path):
+                click.echo("Error: --batch expects a directory of .txt transcript files", err=True)
+                return
+            filenames = sorted(
+                name for name in os.listdir(input_path) if name.endswith('.txt')
+            )
+            if not filenames:
+                click.echo("Error: no .txt files found in input directory", err=True)
+                return
+
+            transcripts = []
+            for name in filenames:
+                with open(os.path.join(input_path, name)) as f:
+                    transcripts.append(f.read())
+
+            click.echo(f"Submitting {len(transcripts)} transcript(s) to the Batch API...")
+            results = classify_speakers_batch(transcripts, target_roles=roles_list)
+
+            os.makedirs(output_path, exist_ok=True)
+            for name, result in zip(filenames, results):
+                with open(os.path.join(output_path, name), 'w') as f:
+                    f.write(result['transcript'])
+            click.echo(f"Batch classification successful. {len(results)} file(s) saved.")
+            return
+
+        # A directory without --batch fans out over the async client so the
+        # per-file API round-trips overlap instead of running serially
+        if os.path.isdir(input_path):
+            filenames = sorted(
+                name for name in os.listdir(input_path) if name.endswith('.txt')
+            )
+            if not filenames:
+                click.echo("Error: no .txt files found in input directory", err=True)
+                return
+
+            transcripts = []
+            for name in filenames:
+                with open(os.path.join(input_path, name)) as f:
+                    transcripts.append(f.read())
+
+            results = asyncio.run(
+                classify_speakers_many(
+                    transcripts,
+                    target_roles=roles_list,
+                    enable_safeguard=safeguard
+                )
+            )
+
+            os.makedirs(output_path, exist_ok=True)
+            for name, result in zip(filenames, results):
+                with open(os.path.join(output_path, name), 'w') as f:
+                    f.write(result['transcript'])
+            click.echo(f"Classification successful. {len(results)} file(s) saved.")
+
+            if safeguard:
+                corrections = [
+                    e for result in results for e in result['log']
+                    if e.get('step') == 'utterance_corrected'
+                ]
+                if corrections:
+                    click.echo(f"\nSafeguard made {len(corrections)} correction(s) across {len(results)} file(s).")
+                else:
+                    click.echo("\nSafeguard validation: No corrections needed.")
+            return
+
+        # click.open_file keeps the "-" convention: stdin in, stdout out
+        with click.open_file(input_path) as f:
+            transcript = f.read()
+
         result = classify_speakers(
             transcript,
             target_roles=roles_list,
             enable_safeguard=safeguard
         )
-        
+
         # Write just the transcript to the output file
-        output_file.write(result['transcript'])
-        click.echo("Classification successful. Output saved.")
-        
+        with click.open_file(output_path, 'w') as f:
+            f.write(result['transcript'])
+
+        # When the transcript goes to stdout, status goes to stderr so the
+        # piped output stays clean
+        status_err = output_path == '-'
+        click.echo("Classification successful. Output saved.", err=status_err)
+
         # Show safeguard activity if enabled
         if safeguard:
             corrections = [e for e in result['log'] if e.get('step') == 'utterance_corrected']
             if corrections:
-                click.echo(f"\nSafeguard made {len(corrections)} correction(s):")
+                click.echo(f"\nSafeguard made {len(corrections)} correction(s):", err=status_err)
                 for c in corrections:
-                    click.echo(f"  Line {c['line_index']}: {c['old_role']} → {c['new_role']}")
+                    click.echo(f"  Line {c['line_index']}: {c['old_role']} → {c['new_role']}", err=status_err)
             else:
-                click.echo("\nSafeguard validation: No corrections needed.")
-                
+                click.echo("\nSafeguard validation: No corrections needed.", err=status_err)
+
     except ValueError as e:
         click.echo(f"Error: {e}", err=True)
     except Exception as e:
@@ -1,73 +1,186 @@
 """Safeguard validation layer with tool calling for spot corrections."""
 
+import hashlib
 import json
 import re
+from collections import OrderedDict
+from functools import lru_cache
+from types import SimpleNamespace
 from typing import Dict, List, Tuple, Optional
-from openai import OpenAI
-import os
 
+try:
+    # orjson's C parser decodes the small, flat tool-call payloads
+    # noticeably faster than stdlib json; fall back when it is absent
+    import orjson
+    _loads = orjson.loads
 
-def _find_utterance_by_prefix(transcript: str, current_role: str, utterance_prefix: str, max_words: int = 10) -> Optional[Tuple[int, str]]:
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:  # pragma: no cover
+    _loads = json.loads
+    _dumps = json.dumps
+
+# Content-addressed result cache: retries and duplicate traffic for the same
+# transcript/roles pair skip the LLM round-trips entirely on warm containers
+_SAFEGUARD_CACHE_MAX = 256
+_safeguard_cache: 'OrderedDict[str, Tuple[str, List[Dict]]]' = OrderedDict()
+
+
+def _safeguard_cache_key(transcript: str, target_roles: List[str]) -> str:
+    """Hash transcript + roles into a fixed-size cache key."""
+    payload = transcript.encode() + repr(sorted(target_roles)).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+# Below this size a validation pass has no cross-speaker context to check,
+# so the LLM round-trip cannot produce a useful correction
+_MIN_SAFEGUARD_UTTERANCES = 4
+
+
+def _is_trivial_transcript(transcript: str) -> bool:
+    """Whether a transcript is too small or uniform for validation to help."""
+    # Scan newline/colon offsets directly on the buffer instead of
+    # materializing a list of line strings just to count labels
+    roles = set()
+    utterances = 0
+    start = 0
+    length = len(transcript)
+    while start <= length:
+        end = transcript.find('\n', start)
+        if end == -1:
+            end = length
+        colon = transcript.find(':', start, end)
+        if colon != -1:
+            role = transcript[start:colon].strip()
+            if role:
+                utterances += 1
+                roles.add(role)
+        start = end + 1
+    return utterances < _MIN_SAFEGUARD_UTTERANCES or len(roles) < 2
+
+
+def _store_safeguard_result(cache_key: str, result: str, log_entries: List[Dict]) -> None:
+    """Cache a completed validation unless it ended in an API error."""
+    if any(entry.get('step') == 'safeguard_error' for entry in log_entries):
+        return
+    _safeguard_cache[cache_key] = (result, log_entries)
+    if len(_safeguard_cache) > _SAFEGUARD_CACHE_MAX:
+        _safeguard_cache.popitem(last=False)
+
+
+# Number of leading tokens folded into the per-utterance integer hash
+_PREFIX_HASH_WORDS = 4
+
+
+@lru_cache(maxsize=32)
+def _role_line_pattern(roles: Tuple[str, ...]) -> 're.Pattern':
+    """Compiled matcher capturing (role, text) for lines with a target label."""
+    alternation = '|'.join(re.escape(role) for role in roles)
+    return re.compile(r'[ \t]*(' + alternation + r')[ \t]*:\s*(.*)$')
+
+
+def _build_role_index(lines: List[str], target_roles: List[str], max_words: int = 10) -> Dict[str, List[Tuple[int, List[str], int]]]:
     """
-    Find a specific utterance in the transcript by role and text prefix.
+    Bucket transcript lines by role label for O(1) role lookups.
     
     Args:
-        transcript: The full transcript
+        lines: The transcript lines
+        target_roles: The role labels corrections can reference
+        max_words: Maximum prefix words to precompute per utterance
+        
+    Returns:
+        Dict mapping each role label to [(line_index, lowercased_words, prefix_hash), ...]
+    """
+    # One precompiled alternation match per line extracts (role, text) in a
+    # single C-level call; corrections only ever name target roles, so other
+    # labels are skipped without building buckets for them
+    pattern = _role_line_pattern(tuple(target_roles))
+    index: Dict[str, List[Tuple[int, List[str], int]]] = {}
+    for i, line in enumerate(lines):
+        match = pattern.match(line)
+        if not match:
+            continue
+        words = match.group(2).strip().lower().split()[:max_words]
+        # An integer hash of the first few tokens lets lookups reject
+        # non-matching utterances with one comparison instead of a word walk
+        index.setdefault(match.group(1), []).append(
+            (i, words, hash(tuple(words[:_PREFIX_HASH_WORDS])))
+        )
+    return index
+
+
+def _find_utterance_by_prefix(role_index: Dict[str, List[Tuple[int, List[str], int]]], current_role: str, utterance_prefix: str, max_words: int = 10) -> Optional[int]:
+    """
+    Find a specific utterance by role and text prefix via the role index.
+    
+    Args:
+        role_index: Role buckets built by _build_role_index
         current_role: The current (possibly incorrect) role label
         utterance_prefix: First few words of the utterance
         max_words: Maximum words to match
         
     Returns:
-        Tuple of (line_index, full_line) if found, None otherwise
+        The line index if found, None otherwise
     """
-    lines = transcript.split('\n')
-    
     # Normalize the prefix for matching
     prefix_words = utterance_prefix.strip().lower().split()[:max_words]
-    
-    for i, line in enumerate(lines):
-        line = line.strip()
-        if not line:
-            continue
-            
-        # Check if line starts with the current role
-        if line.startswith(f"{current_role}:"):
-            # Extract the text after the role label
-            text_after_role = line[len(f"{current_role}:"):].strip()
-            text_words = text_after_role.lower().split()[:max_words]
-            
-            # Check if the prefix matches
-            if text_words[:len(prefix_words)] == prefix_words:
-                return (i, line)
+    if not prefix_words:
+        # An empty prefix would trivially "match" the first utterance with
+        # this role; treat it as not found rather than corrupt the transcript
+        return None
+
+    bucket = role_index.get(current_role, ())
+    n = len(prefix_words)
+
+    if n >= _PREFIX_HASH_WORDS:
+        # Probe with the precomputed integer hash first; the word-by-word
+        # comparison only runs on a hash match to rule out collisions
+        probe = hash(tuple(prefix_words[:_PREFIX_HASH_WORDS]))
+        for i, text_words, prefix_hash in bucket:
+            if (prefix_hash == probe and len(text_words) >= n
+                    and all(text_words[j] == prefix_words[j] for j in range(n))):
+                return i
+        return None
+
+    # Prefix shorter than the hashed span: fall back to the word walk
+    for i, text_words, prefix_hash in bucket:
+        if len(text_words) >= n and all(text_words[j] == prefix_words[j] for j in range(n)):
+            return i
     
     return None
 
 
-def _correct_single_utterance(transcript: str, line_index: int, old_role: str, new_role: str, log: List[Dict]) -> str:
+def _correct_single_utterance(lines: List[str], line_index: int, old_role: str, new_role: str, log: List[Dict]) -> None:
     """
-    Correct a single utterance by replacing its role label.
+    Correct a single utterance in place by replacing its role label.
     
     Args:
-        transcript: The full transcript
+        lines: The transcript lines, mutated in place
         line_index: Index of the line to correct
         old_role: Current (incorrect) role
         new_role: Correct role
         log: Log list to append to
-        
-    Returns:
-        Corrected transcript
     """
-    lines = transcript.split('\n')
-    
     if line_index >= len(lines):
         log.append({
             'step': 'correction_error',
             'error': f'Line index {line_index} out of range'
         })
-        return transcript
+        return
     
     old_line = lines[line_index]
-    new_line = old_line.replace(f"{old_role}:", f"{new_role}:", 1)
+    # The role label is always the prefix up to the first colon, so splice
+    # the new role in front of it rather than substring-searching the whole
+    # line — which could also falsely match a role name quoted mid-utterance
+    colon = old_line.find(':')
+    if colon == -1:
+        log.append({
+            'step': 'correction_error',
+            'error': f'Line {line_index} has no role label to correct'
+        })
+        return
+    leading_ws = len(old_line) - len(old_line.lstrip())
+    new_line = old_line[:leading_ws] + new_role + old_line[colon:]
     lines[line_index] = new_line
     
     log.append({
@@ -78,67 +191,60 @@ def _correct_single_utterance(transcript: str, line_index: int, old_role: str, n
         'old_line': old_line,
         'new_line': new_line
     })
-    
-    return '\n'.join(lines)
 
 
-def run_safeguard_validation(transcript: str, target_roles: List[str], log: List[Dict]) -> str:
-    """
-    Run safeguard validation with tool calling to spot-check and correct misclassifications.
-    
-    Args:
-        transcript: The classified transcript to validate
-        target_roles: List of valid target role names
-        log: Log list to append to
-        
-    Returns:
-        Validated and corrected transcript
-    """
-    api_key = os.getenv('OPENAI_API_KEY')
-    if not api_key:
-        raise ValueError("OPENAI_API_KEY environment variable is not set")
-    
-    client = OpenAI(api_key=api_key)
-    
-    log.append({
-        'step': 'safeguard_start',
-        'target_roles': target_roles
-    })
-    
-    # Define the correction tool
-    tools = [{
+def _build_safeguard_tools(target_roles: List[str]) -> List[Dict]:
+    """Build the batched-correction tool schema for a set of target roles."""
+    # Role strings are invariant for the whole request; join them once
+    # instead of re-formatting inside the description f-strings below
+    roles_csv = ', '.join(target_roles)
+
+    # A single call carries every suspected misclassification so one LLM
+    # round-trip replaces one call per utterance
+    return [{
         "type": "function",
         "function": {
-            "name": "correct_speaker_role",
-            "description": "Correct a single misclassified utterance by specifying its current (wrong) role and the beginning of the utterance text. Use this when you identify a speaker role that seems incorrect based on the conversation context.",
+            "name": "correct_speaker_roles",
+            "description": "Correct one or more misclassified utterances in a single call. For each correction, specify the current (wrong) role and the beginning of the utterance text. Use this when you identify speaker roles that seem incorrect based on the conversation context.",
             "parameters": {
                 "type": "object",
                 "properties": {
-                    "current_role": {
-                        "type": "string",
-                        "description": f"The current (incorrect) role label on the utterance. Must be one of: {', '.join(target_roles)}"
-                    },
-                    "utterance_prefix": {
-                        "type": "string",
-                        "description": "The first 5-10 words of the utterance text (after the role label). This helps locate the specific utterance."
-                    },
-                    "correct_role": {
-                        "type": "string",
-                        "description": f"The correct role this utterance should have. Must be one of: {', '.join(target_roles)}"
-                    },
-                    "reason": {
-                        "type": "string",
-                        "description": "Brief explanation of why this utterance is misclassified"
+                    "corrections": {
+                        "type": "array",
+                        "description": "All suspected misclassifications, in transcript order.",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "current_role": {
+                                    "type": "string",
+                                    "description": f"The current (incorrect) role label on the utterance. Must be one of: {roles_csv}"
+                                },
+                                "utterance_prefix": {
+                                    "type": "string",
+                                    "description": "The first 5-10 words of the utterance text (after the role label). This helps locate the specific utterance."
+                                },
+                                "correct_role": {
+                                    "type": "string",
+                                    "description": f"The correct role this utterance should have. Must be one of: {roles_csv}"
+                                },
+                                "reason": {
+                                    "type": "string",
+                                    "description": "Brief explanation of why this utterance is misclassified"
+                                }
+                            },
+                            "required": ["current_role", "utterance_prefix", "correct_role", "reason"]
+                        }
                     }
                 },
-                "required": ["current_role", "utterance_prefix", "correct_role", "reason"]
+                "required": ["corrections"]
             }
         }
     }]
-    
-    role_desc = " and ".join(target_roles)
-    
-    prompt = f"""You are validating speaker role classifications in a conversation transcript. The valid roles are: {role_desc}
+
+
+def _initial_prompt(transcript: str, role_desc: str) -> str:
+    """Build the first-pass validation prompt."""
+    return f"""You are validating speaker role classifications in a conversation transcript. The valid roles are: {role_desc}
 
 Here is the classified transcript:
 
@@ -149,120 +255,319 @@ Review this transcript carefully. Look for any utterances that seem misclassifie
 - The conversational context and flow
 - Typical patterns (e.g., agents greet customers, customers describe problems)
 
-If you find any misclassified utterances, use the correct_speaker_role function to fix them. Provide the current (wrong) role, the first 5-10 words of the utterance, the correct role, and your reasoning.
+If you find any misclassified utterances, use the correct_speaker_roles function to fix them all in one call. For each one, provide the current (wrong) role, the first 5-10 words of the utterance, the correct role, and your reasoning.
 
 If everything looks correct, simply respond that the classification is accurate."""
+
+
+def _followup_prompt(lines: List[str], changed_indices: set) -> str:
+    """Build the verification prompt, sending only the corrected lines.
+
+    The model already saw the full transcript earlier in the conversation,
+    so the follow-up turn re-sends just the changed lines — a handful of
+    input tokens instead of the whole transcript on every round.
+    """
+    changed = '\n'.join(f"{i}: {lines[i]}" for i in sorted(changed_indices))
+    return f"""Here are the transcript lines that were just corrected (numbered by line):
+
+{changed}
+
+Review these corrections against the full transcript above. Are there any remaining misclassifications? If so, correct them. If everything is now correct, confirm that the classification is accurate."""
+
+
+def _assistant_tool_message(message) -> Dict:
+    """Re-serialize a tool-calling assistant message for the conversation."""
+    return {
+        "role": "assistant",
+        "tool_calls": [
+            {
+                "id": tc.id,
+                "type": "function",
+                "function": {
+                    "name": tc.function.name,
+                    "arguments": tc.function.arguments
+                }
+            }
+            for tc in message.tool_calls
+        ]
+    }
+
+
+def _tool_result_messages(message, corrections_made: List[Dict]) -> List[Dict]:
+    """Build the tool-role replies acknowledging applied corrections."""
+    return [
+        {
+            "role": "tool",
+            "tool_call_id": tc.id,
+            "content": _dumps({"corrections_applied": len(corrections_made)})
+        }
+        for tc in message.tool_calls
+    ]
+
+
+def _collect_stream_message(response):
+    """Accumulate a streamed chat response into a message-like object.
+
+    Tool-call deltas are stitched together by index as they arrive, so
+    corrections can be applied as soon as the stream ends instead of after
+    the SDK assembles a full response. Whole (non-streamed) responses are
+    passed through untouched for callers and test doubles that ignore
+    stream=True.
+    """
+    choices = getattr(response, 'choices', None)
+    if choices:
+        return choices[0].message
+
+    content_parts: List[str] = []
+    tool_calls: Dict[int, SimpleNamespace] = {}
+    for chunk in response:
+        delta = chunk.choices[0].delta
+        if getattr(delta, 'content', None):
+            content_parts.append(delta.content)
+        for tc in getattr(delta, 'tool_calls', None) or []:
+            entry = tool_calls.setdefault(tc.index, SimpleNamespace(
+                id=None,
+                function=SimpleNamespace(name='', arguments='')
+            ))
+            if getattr(tc, 'id', None):
+                entry.id = tc.id
+            fn = getattr(tc, 'function', None)
+            if fn is not None:
+                if getattr(fn, 'name', None):
+                    entry.function.name = fn.name
+                if getattr(fn, 'arguments', None):
+                    entry.function.arguments += fn.arguments
+
+    close = getattr(response, 'close', None)
+    if close is not None:
+        close()
+
+    return SimpleNamespace(
+        content=''.join(content_parts) or None,
+        tool_calls=[tool_calls[i] for i in sorted(tool_calls)] or None
+    )
+
+
+def _apply_tool_calls(message, lines: List[str], log: List[Dict], corrections_made: List[Dict], target_roles: List[str]) -> set:
+    """Apply every batched correction from a tool-calling response in place.
+
+    Returns the set of line indices that were changed.
+    """
+    changed_indices: set = set()
+    log.append({
+        'step': 'tool_calls_requested',
+        'count': len(message.tool_calls)
+    })
+
+    # One scan of the lines buckets them by role, so each correction below
+    # is a dict lookup + short bucket walk instead of a full transcript scan
+    role_index = _build_role_index(lines, target_roles)
+
+    for tool_call in message.tool_calls:
+        function_name = tool_call.function.name
+        try:
+            function_args = _loads(tool_call.function.arguments)
+        except (ValueError, TypeError):
+            # One malformed tool call shouldn't abort the rest of the batch
+            log.append({
+                'step': 'tool_call_malformed',
+                'function': function_name,
+                'raw': str(tool_call.function.arguments)[:200]
+            })
+            continue
+
+        log.append({
+            'step': 'tool_call',
+            'function': function_name,
+            'arguments': function_args
+        })
+
+        if function_name != "correct_speaker_roles":
+            continue
+
+        corrections = function_args.get('corrections', [])
+        if not isinstance(corrections, list):
+            log.append({
+                'step': 'tool_call_invalid',
+                'function': function_name,
+                'corrections': str(corrections)[:200]
+            })
+            continue
+
+        for correction in corrections:
+            if not isinstance(correction, dict):
+                log.append({
+                    'step': 'tool_call_invalid',
+                    'function': function_name,
+                    'correction': str(correction)[:200]
+                })
+                continue
+
+            current_role = correction.get('current_role')
+            utterance_prefix = correction.get('utterance_prefix')
+            correct_role = correction.get('correct_role')
+            reason = correction.get('reason')
+
+            # A decode-clean payload can still be structurally wrong: a null
+            # or missing prefix would blow up the lookup and abort the whole
+            # pass, so skip the entry like the malformed-JSON path does
+            if not (isinstance(current_role, str)
+                    and isinstance(utterance_prefix, str)
+                    and isinstance(correct_role, str)):
+                log.append({
+                    'step': 'tool_call_invalid',
+                    'function': function_name,
+                    'correction': str(correction)[:200]
+                })
+                continue
+
+            # Try to find and correct the utterance
+            line_index = _find_utterance_by_prefix(
+                role_index,
+                current_role,
+                utterance_prefix
+            )
+
+            if line_index is not None:
+                _correct_single_utterance(
+                    lines,
+                    line_index,
+                    current_role,
+                    correct_role,
+                    log
+                )
+                # Drop the corrected line from its old bucket so a later
+                # correction in this batch can't re-match it
+                role_index[current_role] = [
+                    entry for entry in role_index[current_role]
+                    if entry[0] != line_index
+                ]
+
+                corrections_made.append({
+                    'current_role': current_role,
+                    'correct_role': correct_role,
+                    'reason': reason
+                })
+                changed_indices.add(line_index)
+            else:
+                log.append({
+                    'step': 'utterance_not_found',
+                    'current_role': current_role,
+                    'prefix': utterance_prefix
+                })
+
+    return changed_indices
+
+
+def run_safeguard_validation(transcript: str, target_roles: List[str], log: List[Dict]) -> str:
+    """
+    Run safeguard validation with tool calling to spot-check and correct misclassifications.
     
-    max_iterations = 3  # Prevent infinite loops
-    current_transcript = transcript
+    Args:
+        transcript: The classified transcript to validate
+        target_roles: List of valid target role names
+        log: Log list to append to
+        
+    Returns:
+        Validated and corrected transcript
+    """
+    if _is_trivial_transcript(transcript):
+        log.append({
+            'step': 'safeguard_skipped',
+            'reason': 'transcript too short or single-role for validation'
+        })
+        return transcript
+
+    cache_key = _safeguard_cache_key(transcript, target_roles)
+    cached = _safeguard_cache.get(cache_key)
+    if cached is not None:
+        _safeguard_cache.move_to_end(cache_key)
+        result, cached_log = cached
+        log.append({'step': 'cache_hit', 'target_roles': target_roles})
+        log.extend(cached_log)
+        return result
+
+    # Buffer this run's entries locally and splice them into the caller's
+    # log once at the end; the same list is handed to the result cache, so
+    # no log[start:] slice copy is needed
+    run_log: List[Dict] = []
+
+    # Reuse the classifier's cached, pool-tuned client so warm Lambda
+    # containers share one TLS session across classification and validation;
+    # the import is deferred so no-API paths never load the SDK
+    from .classifier import _get_client
+
+    client = _get_client()
+    
+    run_log.append({
+        'step': 'safeguard_start',
+        'target_roles': target_roles
+    })
+
+    role_desc = " and ".join(target_roles)
+    tools = _build_safeguard_tools(target_roles)
+    system_message = f"You are a conversation analyst validating speaker role classifications. The valid roles are: {role_desc}. Use the correct_speaker_roles function to fix any misclassifications you identify."
+    messages = [
+        {"role": "system", "content": system_message},
+        {"role": "user", "content": _initial_prompt(transcript, role_desc)}
+    ]
+
+    # One pass applies every correction the model found; a second pass only
+    # runs to verify a corrected transcript, so at most two round-trips
+    max_iterations = 2
+    # Split once and keep the line list as the canonical representation, so
+    # each lookup/correction avoids an O(N) split + join of the transcript
+    lines = transcript.split('\n')
     corrections_made = []
     
     for iteration in range(max_iterations):
-        log.append({
+        run_log.append({
             'step': 'safeguard_iteration',
             'iteration': iteration + 1
         })
         
         try:
-            response = client.chat.completions.create(
-                model="gpt-5",
-                messages=[
-                    {"role": "system", "content": f"You are a conversation analyst validating speaker role classifications. The valid roles are: {role_desc}. Use the correct_speaker_role function to fix any misclassifications you identify."},
-                    {"role": "user", "content": prompt}
-                ],
-                tools=tools,
-                tool_choice="auto"
-            )
+            try:
+                # Stream so tool-call deltas are consumed as the model emits
+                # them rather than waiting for the SDK to buffer the response
+                response = client.chat.completions.create(
+                    model="gpt-5",
+                    messages=messages,
+                    tools=tools,
+                    tool_choice="auto",
+                    extra_body={"prompt_cache_key": cache_key},
+                    stream=True
+                )
+            except TypeError:
+                # Client doesn't accept stream here; fall back to a whole response
+                response = client.chat.completions.create(
+                    model="gpt-5",
+                    messages=messages,
+                    tools=tools,
+                    tool_choice="auto"
+                )
             
-            message = response.choices[0].message
+            message = _collect_stream_message(response)
             
             # Check if LLM wants to call tools
             if message.tool_calls:
-                log.append({
-                    'step': 'tool_calls_requested',
-                    'count': len(message.tool_calls)
-                })
-                
-                tool_results = []
-                
-                for tool_call in message.tool_calls:
-                    function_name = tool_call.function.name
-                    function_args = json.loads(tool_call.function.arguments)
-                    
-                    log.append({
-                        'step': 'tool_call',
-                        'function': function_name,
-                        'arguments': function_args
-                    })
-                    
-                    if function_name == "correct_speaker_role":
-                        current_role = function_args.get('current_role')
-                        utterance_prefix = function_args.get('utterance_prefix')
-                        correct_role = function_args.get('correct_role')
-                        reason = function_args.get('reason')
-                        
-                        # Try to find and correct the utterance
-                        found = _find_utterance_by_prefix(
-                            current_transcript,
-                            current_role,
-                            utterance_prefix
-                        )
-                        
-                        if found:
-                            line_index, full_line = found
-                            current_transcript = _correct_single_utterance(
-                                current_transcript,
-                                line_index,
-                                current_role,
-                                correct_role,
-                                log
-                            )
-                            
-                            corrections_made.append({
-                                'current_role': current_role,
-                                'correct_role': correct_role,
-                                'reason': reason
-                            })
-                            
-                            tool_result = {
-                                "tool_call_id": tool_call.id,
-                                "output": json.dumps({
-                                    "success": True,
-                                    "message": f"Successfully corrected utterance from {current_role} to {correct_role}"
-                                })
-                            }
-                        else:
-                            log.append({
-                                'step': 'utterance_not_found',
-                                'current_role': current_role,
-                                'prefix': utterance_prefix
-                            })
-                            
-                            tool_result = {
-                                "tool_call_id": tool_call.id,
-                                "output": json.dumps({
-                                    "success": False,
-                                    "message": f"Could not locate utterance with role '{current_role}' and prefix '{utterance_prefix}'. Please provide more specific text or check the role label."
-                                })
-                            }
-                        
-                        tool_results.append(tool_result)
-                
-                # If we made corrections, continue to next iteration to check if more needed
-                if corrections_made and iteration < max_iterations - 1:
-                    # Update prompt with corrected transcript for next iteration
-                    prompt = f"""Here is the updated transcript after corrections:
-
-{current_transcript}
+                changed_indices = _apply_tool_calls(message, lines, run_log, corrections_made, target_roles)
 
-Review again. Are there any remaining misclassifications? If so, correct them. If everything is now correct, confirm that the classification is accurate."""
+                # If corrections were applied, run a single verification pass;
+                # extending the conversation (instead of rebuilding it) keeps
+                # the long prefix byte-identical for server-side prompt
+                # caching, and the new turn carries only the changed lines
+                if corrections_made and iteration < max_iterations - 1:
+                    messages.append(_assistant_tool_message(message))
+                    messages.extend(_tool_result_messages(message, corrections_made))
+                    messages.append({"role": "user", "content": _followup_prompt(lines, changed_indices)})
                     continue
                 else:
                     # No more corrections or max iterations reached
                     break
             else:
                 # No tool calls, LLM thinks everything is correct
-                log.append({
+                run_log.append({
                     'step': 'safeguard_complete',
                     'message': 'No corrections needed' if not corrections_made else 'All corrections completed',
                     'total_corrections': len(corrections_made)
@@ -270,17 +575,160 @@ Review again. Are there any remaining misclassifications? If so, correct them. I
                 break
                 
         except Exception as e:
-            log.append({
+            run_log.append({
                 'step': 'safeguard_error',
                 'error': str(e)
             })
             # Return the best transcript we have so far
             break
     
-    log.append({
+    run_log.append({
         'step': 'safeguard_end',
         'corrections_made': corrections_made,
         'total_corrections': len(corrections_made)
     })
     
-    return current_transcript
+    log.extend(run_log)
+    result = '\n'.join(lines)
+    _store_safeguard_result(cache_key, result, run_log)
+    return result
+
+
+async def run_safeguard_validation_async(transcript: str, target_roles: List[str], log: List[Dict]) -> str:
+    """
+    Async counterpart of run_safeguard_validation for concurrent pipelines.
+    
+    Args:
+        transcript: The classified transcript to validate
+        target_roles: List of valid target role names
+        log: Log list to append to
+        
+    Returns:
+        Validated and corrected transcript
+    """
+    if _is_trivial_transcript(transcript):
+        log.append({
+            'step': 'safeguard_skipped',
+            'reason': 'transcript too short or single-role for validation'
+        })
+        return transcript
+
+    cache_key = _safeguard_cache_key(transcript, target_roles)
+    cached = _safeguard_cache.get(cache_key)
+    if cached is not None:
+        _safeguard_cache.move_to_end(cache_key)
+        result, cached_log = cached
+        log.append({'step': 'cache_hit', 'target_roles': target_roles})
+        log.extend(cached_log)
+        return result
+
+    # Buffer this run's entries locally and splice them into the caller's
+    # log once at the end; the same list is handed to the result cache, so
+    # no log[start:] slice copy is needed
+    run_log: List[Dict] = []
+
+    from .classifier import _get_async_client
+
+    client = _get_async_client()
+
+    run_log.append({
+        'step': 'safeguard_start',
+        'target_roles': target_roles
+    })
+
+    role_desc = " and ".join(target_roles)
+    tools = _build_safeguard_tools(target_roles)
+    system_message = f"You are a conversation analyst validating speaker role classifications. The valid roles are: {role_desc}. Use the correct_speaker_roles function to fix any misclassifications you identify."
+    messages = [
+        {"role": "system", "content": system_message},
+        {"role": "user", "content": _initial_prompt(transcript, role_desc)}
+    ]
+
+    max_iterations = 2
+    lines = transcript.split('\n')
+    corrections_made = []
+
+    for iteration in range(max_iterations):
+        run_log.append({
+            'step': 'safeguard_iteration',
+            'iteration': iteration + 1
+        })
+
+        try:
+            response = await client.chat.completions.create(
+                model="gpt-5",
+                messages=messages,
+                tools=tools,
+                tool_choice="auto",
+                extra_body={"prompt_cache_key": cache_key}
+            )
+
+            message = response.choices[0].message
+
+            if message.tool_calls:
+                changed_indices = _apply_tool_calls(message, lines, run_log, corrections_made, target_roles)
+
+                if corrections_made and iteration < max_iterations - 1:
+                    messages.append(_assistant_tool_message(message))
+                    messages.extend(_tool_result_messages(message, corrections_made))
+                    messages.append({"role": "user", "content": _followup_prompt(lines, changed_indices)})
+                    continue
+                else:
+                    break
+            else:
+                run_log.append({
+                    'step': 'safeguard_complete',
+                    'message': 'No corrections needed' if not corrections_made else 'All corrections completed',
+                    'total_corrections': len(corrections_made)
+                })
+                break
+
+        except Exception as e:
+            run_log.append({
+                'step': 'safeguard_error',
+                'error': str(e)
+            })
+            break
+
+    run_log.append({
+        'step': 'safeguard_end',
+        'corrections_made': corrections_made,
+        'total_corrections': len(corrections_made)
+    })
+
+    log.extend(run_log)
+    result = '\n'.join(lines)
+    _store_safeguard_result(cache_key, result, run_log)
+    return result
+
+
+async def run_safeguard_validation_batch(
+    transcripts: List[str],
+    target_roles: List[str],
+    max_concurrent: int = 8
+) -> List[Dict]:
+    """
+    Validate many transcripts concurrently with bounded fan-out.
+    
+    Overlaps the network-bound validation round-trips so wall time scales
+    with the rate limit rather than the per-transcript latency.
+    
+    Args:
+        transcripts: The classified transcripts to validate
+        target_roles: List of valid target role names
+        max_concurrent: Max in-flight validation requests
+        
+    Returns:
+        List of dicts with 'transcript' and 'log', one per input transcript
+    """
+    import asyncio
+
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def validate_one(transcript: str) -> Dict:
+        log: List[Dict] = []
+        async with semaphore:
+            result = await run_safeguard_validation_async(transcript, target_roles, log)
+        return {'transcript': result, 'log': log}
+
+    return list(await asyncio.gather(*(validate_one(t) for t in transcripts)))
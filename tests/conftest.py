@@ -3,7 +3,49 @@
 import pytest
 import os
 import json
-from unittest.mock import Mock
+import re
+from itertools import cycle
+from types import SimpleNamespace
+
+# Compiled once: the mock runs for every non-integration API call, so the
+# per-call re module cache lookup is worth skipping
+_ROLES_RE = re.compile(r'these roles:\s*([^.]+)')
+
+# Fixed role labels are matched with a C-level startswith over this tuple;
+# only the open-ended "Speaker N" form still needs the regex
+_FIXED_PREFIXES = ('Agent:', 'Customer:', 'Sales:', 'Lead:', 'Caller:', 'Unknown:')
+_SPEAKER_N_RE = re.compile(r'Speaker \d+:')
+
+# The suite exercises only a handful of (roles, speakers) combinations, so
+# completed response objects are memoized instead of rebuilt per call
+_COMPLETION_CACHE = {}
+
+# Scenarios repeat near-identical prompts; remembering the (roles, speakers)
+# extracted from each distinct messages payload skips the regex walk entirely
+_PROMPT_CACHE = {}
+
+
+class _FakeMessage:
+    """Minimal chat message: attribute reads only, no Mock bookkeeping."""
+    __slots__ = ('content', 'tool_calls')
+
+    def __init__(self, content):
+        self.content = content
+        self.tool_calls = None
+
+
+class _FakeChoice:
+    __slots__ = ('message',)
+
+    def __init__(self, content):
+        self.message = _FakeMessage(content)
+
+
+class _FakeCompletion:
+    __slots__ = ('choices',)
+
+    def __init__(self, content):
+        self.choices = [_FakeChoice(content)]
 
 
 def pytest_configure(config):
@@ -13,97 +55,175 @@ def pytest_configure(config):
     )
 
 
-@pytest.fixture(autouse=True)
-def mock_openai_by_default(monkeypatch, request):
-    """Mock OpenAI API calls by default unless test is marked as integration."""
-    # Skip mocking if test is marked as integration
-    if 'integration' in request.keywords:
-        yield None
-        return
+# Create a smart mock that responds based on the prompt
+def _mock_create(**kwargs):
+    """Smart mock that extracts target roles from the prompt."""
+    messages = kwargs.get('messages', [])
+
+    prompt_key = tuple((m.get('role'), m.get('content')) for m in messages)
+    cached_prompt = _PROMPT_CACHE.get(prompt_key)
+    if cached_prompt is not None:
+        roles, speakers = cached_prompt
+        return _completion_for(roles, speakers)
+
+    # Default roles
+    roles = ["Agent", "Customer"]
     
-    # Create a smart mock that responds based on the prompt
-    def mock_create(**kwargs):
-        """Smart mock that extracts target roles from the prompt."""
-        messages = kwargs.get('messages', [])
-        
-        # Default roles
-        roles = ["Agent", "Customer"]
-        
-        # Try to extract target_roles from the system message
-        # System message format: "...these roles: Sales and Lead" or "...these roles: Agent and Customer"
-        for msg in messages:
-            if msg.get('role') == 'system':
-                content = msg.get('content', '')
-                # Look for "these roles: X and Y" pattern
-                import re
-                role_match = re.search(r'these roles:\s*([^.]+)', content)
-                if role_match:
-                    role_str = role_match.group(1).strip()
-                    # Split by "and" to get individual roles
-                    found_roles = [r.strip() for r in role_str.split(' and ')]
-                    if found_roles and all(found_roles):
-                        roles = found_roles
-        
-        # Try to extract user message for speaker detection
-        user_msg = None
-        for msg in messages:
-            if msg.get('role') == 'user':
-                user_msg = msg.get('content', '')
-                break
-        
-        # Extract speaker labels from transcript
-        speakers = []
-        if user_msg:
-            import re
-            # Match "Speaker N" or role names (Agent, Customer, etc.) but not full sentences
-            speaker_pattern = r'^(Speaker \d+|Agent|Customer|Sales|Lead|Caller|Unknown):'
-            for line in user_msg.split('\n'):
-                line = line.strip()
-                if not line or line.startswith('Example') or line.startswith('Here is'):
-                    continue
-                match = re.match(speaker_pattern, line)
-                if match:
-                    speaker = match.group(1).strip()
-                    if speaker not in speakers:
-                        speakers.append(speaker)
-        
-        # Default to Speaker 0, Speaker 1 if not found
-        if not speakers:
-            speakers = ["Speaker 0", "Speaker 1"]
-        
-        # Create mapping: alternate speakers to roles
-        mapping = {}
-        for i, speaker in enumerate(speakers):
-            mapping[speaker] = roles[i % len(roles)]
-        
-        mock_completion = Mock()
-        mock_completion.choices = [Mock(message=Mock(content=json.dumps(mapping)))]
-        return mock_completion
+    # Try to extract target_roles from the system message
+    # System message format: "...these roles: Sales and Lead" or "...these roles: Agent and Customer"
+    for msg in messages:
+        if msg.get('role') == 'system':
+            content = msg.get('content', '')
+            # Literal anchor first: a C-level substring scan is far cheaper
+            # than spinning up the regex engine on prompts without the phrase
+            if 'these roles:' not in content:
+                continue
+            role_match = _ROLES_RE.search(content)
+            if role_match:
+                role_str = role_match.group(1).strip()
+                # Split by "and" to get individual roles
+                found_roles = [r.strip() for r in role_str.split(' and ')]
+                if found_roles and all(found_roles):
+                    roles = found_roles
+    
+    # Try to extract user message for speaker detection
+    user_msg = None
+    for msg in messages:
+        if msg.get('role') == 'user':
+            user_msg = msg.get('content', '')
+            break
     
-    # Mock the OpenAI client
-    mock_client = Mock()
-    mock_client.chat.completions.create = mock_create
+    # Extract speaker labels from transcript
+    speakers = []
+    if user_msg and len(roles) == 2 and 'Speaker 0:' in user_msg and 'Speaker 1:' in user_msg \
+            and 'Speaker 2:' not in user_msg and not any(p in user_msg for p in _FIXED_PREFIXES):
+        # Fast path for the most common fixture shape: exactly the two
+        # numbered speakers and nothing else, so skip the line scan
+        speakers = ['Speaker 0', 'Speaker 1']
+    elif user_msg:
+        # Match "Speaker N" or role names (Agent, Customer, etc.) but not full sentences
+        for raw in user_msg.splitlines():
+            line = raw.strip()
+            # Cheap first-char gate for the 'Example'/'Here is' prose lines;
+            # no recognized speaker label starts with E or H, so this can't
+            # skip a real speaker line
+            if not line or line[0] in 'EH':
+                continue
+            if line.startswith(_FIXED_PREFIXES):
+                speaker = line.split(':', 1)[0]
+            else:
+                match = _SPEAKER_N_RE.match(line)
+                if not match:
+                    continue
+                speaker = line[:match.end() - 1]
+            if speaker not in speakers:
+                speakers.append(speaker)
     
-    # Patch the OpenAI client creation
-    from unittest.mock import patch
-    with patch('speaker_role_classifier.classifier.OpenAI', return_value=mock_client):
-        yield mock_client
+    # Default to Speaker 0, Speaker 1 if not found
+    if not speakers:
+        speakers = ["Speaker 0", "Speaker 1"]
+
+    _PROMPT_CACHE[prompt_key] = (roles, speakers)
+    return _completion_for(roles, speakers)
+
+
+def _completion_for(roles, speakers):
+    """Return the (memoized) completion mapping speakers onto roles."""
+    # Create mapping: alternate speakers to roles; zip + cycle keeps the
+    # pairing loop in C instead of a Python-level index/modulo per speaker
+    mapping = dict(zip(speakers, cycle(roles)))
+
+    key = tuple(mapping.items())
+    cached = _COMPLETION_CACHE.get(key)
+    if cached is None:
+        cached = _FakeCompletion(json.dumps(mapping))
+        _COMPLETION_CACHE[key] = cached
+    return cached
+
+
+class _FakeClient:
+    """Hand-rolled OpenAI client double exposing chat.completions.create."""
+    __slots__ = ('chat',)
+
+    def __init__(self, create):
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=create))
+
+
+# One shared client for the whole session: the smart mock is stateless, so
+# nothing needs rebuilding per test
+_SHARED_MOCK_CLIENT = _FakeClient(_mock_create)
+
+# Toggled by the per-test fixture so integration tests reach the real API
+# without tearing the session-wide patch down and back up
+_use_real_api = False
+
+
+def _openai_factory(*args, **kwargs):
+    """Stand-in for the OpenAI constructor installed for the whole session."""
+    if _use_real_api:
+        import openai
+        return openai.OpenAI(*args, **kwargs)
+    return _SHARED_MOCK_CLIENT
+
+
+@pytest.fixture(scope="session", autouse=True)
+def patch_openai_client():
+    """Install the OpenAI patch once per session instead of once per test."""
+    mp = pytest.MonkeyPatch()
+    mp.setattr('speaker_role_classifier.classifier.OpenAI', _openai_factory)
+    yield
+    mp.undo()
+
+
+def pytest_runtest_setup(item):
+    """Point the OpenAI factory at the real API only for integration tests.
+
+    A plain hook instead of an autouse fixture: flipping the flag here skips
+    the per-test fixture setup/finalizer protocol entirely. The classifier
+    caches whatever client it built first, so when the mode flips the cached
+    clients are dropped too — otherwise the first test to run would pin its
+    client (mock or real) for the rest of the session.
+    """
+    global _use_real_api
+    use_real_api = 'integration' in item.keywords
+    if use_real_api != _use_real_api:
+        from speaker_role_classifier import classifier
+        classifier._client = None
+        classifier._async_client = None
+        _use_real_api = use_real_api
 
 
 @pytest.fixture
 def context():
-    """Shared context dictionary for BDD tests."""
-    return {}
+    """Shared context namespace for BDD tests.
+
+    Attribute access instead of a string-keyed dict: steps read and write
+    these fields hundreds of times across the suite, and every field a step
+    may probe before it is set defaults to None (is_lambda to False).
+    """
+    return SimpleNamespace(
+        transcript=None,
+        target_roles=None,
+        result=None,
+        error=None,
+        log=None,
+        log_by_step=None,
+        lambda_response=None,
+        lambda_body=None,
+        mock_response=None,
+        should_raise=None,
+        is_lambda=False,
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_transcript():
     """A simple two-speaker transcript."""
     return """Speaker 0: Hello, thanks for calling ABC Plumbing Services, how may I help you?
 Speaker 1: Hi, I have a big emergency! My faucet broke and it's flowing and it won't stop!"""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def multiline_transcript():
     """A transcript with multiple lines per speaker."""
     return """Speaker 0: Hello, thanks for calling ABC Plumbing Services, how may I help you?
@@ -112,7 +232,7 @@ Speaker 0: I understand, that sounds stressful. Let me help you with that.
 Speaker 1: Thank you so much! I really appreciate it."""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def three_speaker_transcript():
     """A transcript with three speakers."""
     return """Speaker 0: Hello, thanks for calling ABC Plumbing Services.
@@ -120,7 +240,7 @@ Speaker 1: Hi, I need help.
 Speaker 2: I'm also on the line."""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def formatted_transcript():
     """A transcript with specific formatting to preserve."""
     return """Speaker 0: Hello, thanks for calling ABC Plumbing Services, how may I help you?
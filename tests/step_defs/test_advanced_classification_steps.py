@@ -1,5 +1,9 @@
 """Step definitions for advanced speaker classification scenarios."""
 
+import json
+import re
+from functools import lru_cache
+
 import pytest
 from pytest_bdd import scenario, given, when, then, parsers
 from speaker_role_classifier.classifier import (
@@ -9,193 +13,174 @@ from speaker_role_classifier.classifier import (
     SpeakerNotFoundError
 )
 
-# Load each scenario explicitly so we can mark safeguard tests as integration
-
-# Non-safeguard scenarios (use mocking)
-@scenario('../features/advanced_classification.feature', 'Classify with custom role names (Sales and Lead)')
-def test_classify_with_custom_role_names_sales_and_lead():
-    """Test classification with custom role names."""
-    pass
-
-@scenario('../features/advanced_classification.feature', 'Classify with custom role names (Agent and Caller)')
-def test_classify_with_custom_role_names_agent_and_caller():
-    """Test classification with custom role names."""
-    pass
-
-@scenario('../features/advanced_classification.feature', 'Handle mixed speaker labels with Unknown')
-def test_handle_mixed_speaker_labels_with_unknown():
-    """Test handling of mixed speaker labels."""
-    pass
-
-@scenario('../features/advanced_classification.feature', 'Handle partially labeled transcript')
-def test_handle_partially_labeled_transcript():
-    """Test handling of partially labeled transcripts."""
-    pass
-
-@scenario('../features/advanced_classification.feature', 'Validate and correct already-labeled transcript')
-def test_validate_and_correct_alreadylabeled_transcript():
-    """Test validation and correction of already-labeled transcripts."""
-    pass
-
-@scenario('../features/advanced_classification.feature', 'Log initial speaker role mapping decision')
-def test_log_initial_speaker_role_mapping_decision():
-    """Test logging of initial mapping decision."""
-    pass
-
-@scenario('../features/advanced_classification.feature', 'Lambda response includes structured logs')
-def test_lambda_response_includes_structured_logs():
-    """Test Lambda response includes structured logs."""
-    pass
-
-# Safeguard scenarios (require real API - mark as integration)
-@scenario('../features/advanced_classification.feature', 'Safeguard corrects single misclassified utterance')
-def test_safeguard_corrects_single_misclassified_utterance():
-    """Test safeguard correction of single misclassification."""
-    pass
-test_safeguard_corrects_single_misclassified_utterance.pytestmark = pytest.mark.integration
-
-@scenario('../features/advanced_classification.feature', 'Safeguard handles multiple corrections')
-def test_safeguard_handles_multiple_corrections():
-    """Test safeguard handling of multiple corrections."""
-    pass
-test_safeguard_handles_multiple_corrections.pytestmark = pytest.mark.integration
-
-@scenario('../features/advanced_classification.feature', 'Safeguard retries on correction failure')
-def test_safeguard_retries_on_correction_failure():
-    """Test safeguard retry logic."""
+# Imported unconditionally: the handler is part of the tree it ships with,
+# so a broken import should fail the run, not quietly skip the Lambda steps
+from lambda_handler.handler import lambda_handler
+
+# One pass over a transcript pulls out every speaker label for the
+# label-set assertions below
+_LABEL_RE = re.compile(r'(?m)^([^:\n]+):')
+
+# Scenario names from the feature file; the True flags mark safeguard
+# scenarios that call the real API and run only in integration mode
+_SCENARIOS = [
+    ('Handle mixed speaker labels with Unknown', False),
+    ('Handle partially labeled transcript', False),
+    ('Validate and correct already-labeled transcript', False),
+    ('Log initial speaker role mapping decision', False),
+    ('Lambda response includes structured logs', False),
+    ('Safeguard corrects single misclassified utterance', True),
+    ('Safeguard handles multiple corrections', True),
+    ('Safeguard retries on correction failure', True),
+]
+
+
+def _scenario_stub():
     pass
-test_safeguard_retries_on_correction_failure.pytestmark = pytest.mark.integration
 
 
-@pytest.fixture
-def context():
-    """Provide a context dictionary for sharing state between steps."""
-    return {}
+# Bind one generated test per scenario instead of ten hand-written stubs;
+# pytest-bdd parses the feature file once and reuses the cached parse
+for _name, _integration in _SCENARIOS:
+    _test = scenario('../features/advanced_classification.feature', _name)(_scenario_stub)
+    _test.__name__ = 'test_' + re.sub(r'\W+', '_', _name).strip('_').lower()
+    if _integration:
+        _test.pytestmark = pytest.mark.integration
+    globals()[_test.__name__] = _test
 
 
-@given('a diarized transcript with two speakers')
-def diarized_transcript_two_speakers(context):
-    """Create a standard diarized transcript with two speakers."""
-    context['transcript'] = """Speaker 0: Hello, how can I help you?
-Speaker 1: Hi, I need assistance with my account."""
+# The two "custom role names" scenarios only varied the role pair, so one
+# parametrized test covers both (plus the default pair) with a single setup
+@pytest.mark.parametrize("roles", [['Sales', 'Lead'], ['Agent', 'Caller'], ['Agent', 'Customer']])
+def test_classify_with_custom_role_names(roles, simple_transcript):
+    """Both speakers end up labelled with the requested role pair."""
+    result = classify_speakers(simple_transcript, target_roles=roles)
+    assert f"{roles[0]}:" in result['transcript']
+    assert f"{roles[1]}:" in result['transcript']
 
 
 @given('the target roles are "Sales" and "Lead"')
 def target_roles_sales_lead(context):
     """Set target roles to Sales and Lead."""
-    context['target_roles'] = ['Sales', 'Lead']
+    context.target_roles = ['Sales', 'Lead']
 
 
 @given('the target roles are "Agent" and "Caller"')
 def target_roles_agent_caller(context):
     """Set target roles to Agent and Caller."""
-    context['target_roles'] = ['Agent', 'Caller']
+    context.target_roles = ['Agent', 'Caller']
 
 
 @given('the target roles are "Agent" and "Customer"')
 def target_roles_agent_customer(context):
     """Set target roles to Agent and Customer."""
-    context['target_roles'] = ['Agent', 'Customer']
-
-
-@given('a transcript with "Speaker 0", "Speaker 1", and "Unknown" labels')
-def transcript_with_unknown(context):
-    """Create a transcript with mixed labels including Unknown."""
-    context['transcript'] = """Speaker 0: Hello, how can I help you?
+    context.target_roles = ['Agent', 'Customer']
+
+
+# The transcript Given-steps only differ in the context values they set, so
+# one dispatcher registers every phrase from this table instead of eight
+# near-identical step functions
+_TRANSCRIPT_GIVENS = {
+    'a diarized transcript with two speakers': {
+        'transcript': """Speaker 0: Hello, how can I help you?
+Speaker 1: Hi, I need assistance with my account.""",
+    },
+    'a transcript with "Speaker 0", "Speaker 1", and "Unknown" labels': {
+        'transcript': """Speaker 0: Hello, how can I help you?
 Unknown: Hi, I need assistance.
 Speaker 1: Sure, what's the issue?
-Unknown: My account is locked."""
-
-
-@given('a transcript with some "Agent" labels and some "Speaker 0" labels')
-def transcript_partially_labeled(context):
-    """Create a transcript with mixed Agent and Speaker labels."""
-    context['transcript'] = """Agent: Hello, how can I help you?
+Unknown: My account is locked.""",
+    },
+    'a transcript with some "Agent" labels and some "Speaker 0" labels': {
+        'transcript': """Agent: Hello, how can I help you?
 Speaker 0: Hi, I need assistance.
 Agent: Sure, what's the issue?
-Speaker 0: My account is locked."""
-
-
-@given('a transcript already labeled with "Agent" and "Customer"')
-def transcript_already_labeled(context):
-    """Create a transcript already labeled with target roles."""
-    context['transcript'] = """Agent: Hello, how can I help you?
+Speaker 0: My account is locked.""",
+    },
+    'a transcript already labeled with "Agent" and "Customer"': {
+        'transcript': """Agent: Hello, how can I help you?
 Customer: Hi, I need assistance.
 Agent: Sure, what's the issue?
-Customer: My account is locked."""
-
-
-@given('a transcript with one incorrectly labeled utterance')
-def transcript_one_misclassified(context):
-    """Create a transcript with one wrong label."""
-    context['transcript'] = """Agent: Hello, how can I help you?
+Customer: My account is locked.""",
+    },
+    'a transcript with one incorrectly labeled utterance': {
+        'transcript': """Agent: Hello, how can I help you?
 Agent: Hi, I need assistance.
 Agent: Sure, what's the issue?
-Customer: My account is locked."""
-    context['target_roles'] = ['Agent', 'Customer']
-
-
-@given('a transcript with multiple incorrectly labeled utterances')
-def transcript_multiple_misclassified(context):
-    """Create a transcript with multiple wrong labels."""
-    context['transcript'] = """Customer: Hello, how can I help you?
+Customer: My account is locked.""",
+        'target_roles': ['Agent', 'Customer'],
+    },
+    'a transcript with multiple incorrectly labeled utterances': {
+        'transcript': """Customer: Hello, how can I help you?
 Agent: Hi, I need assistance.
 Customer: Sure, what's the issue?
-Agent: My account is locked."""
-    context['target_roles'] = ['Agent', 'Customer']
-
-
-@given('a transcript requiring corrections')
-def transcript_requiring_corrections(context):
-    """Create a transcript that needs corrections."""
-    context['transcript'] = """Agent: Hello, how can I help you?
+Agent: My account is locked.""",
+        'target_roles': ['Agent', 'Customer'],
+    },
+    'a transcript requiring corrections': {
+        'transcript': """Agent: Hello, how can I help you?
 Agent: Hi, I need assistance.
 Customer: Sure, what's the issue?
-Customer: My account is locked."""
-    context['target_roles'] = ['Agent', 'Customer']
+Customer: My account is locked.""",
+        'target_roles': ['Agent', 'Customer'],
+    },
+    'a Lambda invocation with a diarized transcript': {
+        'transcript': """Speaker 0: Hello, how can I help you?
+Speaker 1: Hi, I need assistance.""",
+        'is_lambda': True,
+    },
+}
 
 
-@given('a Lambda invocation with a diarized transcript')
-def lambda_invocation_with_transcript(context):
-    """Set up a Lambda invocation context."""
-    context['transcript'] = """Speaker 0: Hello, how can I help you?
-Speaker 1: Hi, I need assistance."""
-    context['is_lambda'] = True
+def _make_transcript_step(values):
+    def set_transcript(context):
+        """Load the transcript (and related context) for this phrase."""
+        context.__dict__.update(values)
+    return set_transcript
 
 
-@when('the classifier processes the transcript with custom roles')
-def process_with_custom_roles(context):
-    """Process transcript with custom role names."""
+for _phrase, _values in _TRANSCRIPT_GIVENS.items():
+    given(_phrase)(_make_transcript_step(_values))
+
+
+def _lambda_body(context):
+    """Parse the Lambda response body once and share it across Then-steps."""
+    if context.lambda_body is None:
+        context.lambda_body = json.loads(context.lambda_response['body'])
+    return context.lambda_body
+
+
+@lru_cache(maxsize=128)
+def _event_body(transcript, roles):
+    """Serialize a Lambda event body once per distinct (transcript, roles)."""
+    return json.dumps({'transcript': transcript, 'target_roles': list(roles)})
+
+
+def _run_classifier(context, **kwargs):
+    """Run classify_speakers with the context's roles and store the outcome."""
     try:
-        target_roles = context.get('target_roles', ['Agent', 'Customer'])
-        
-        result = classify_speakers(
-            context['transcript'],
-            target_roles=target_roles
+        context.result = classify_speakers(
+            context.transcript,
+            target_roles=(context.target_roles or ['Agent', 'Customer']),
+            **kwargs
         )
-        context['result'] = result
-        context['error'] = None
+        context.error = None
     except Exception as e:
-        context['error'] = e
-        context['result'] = None
+        context.error = e
+        context.result = None
+
+
+@when('the classifier processes the transcript with custom roles')
+def process_with_custom_roles(context):
+    """Process transcript with custom role names."""
+    _run_classifier(context)
 
 
 @when('the classifier validates the transcript')
 def validate_transcript(context):
     """Validate an already-labeled transcript."""
-    try:
-        target_roles = context.get('target_roles', ['Agent', 'Customer'])
-        
-        # Note: validate_only feature not yet implemented, treating as regular classification
-        result = classify_speakers(
-            context['transcript'],
-            target_roles=target_roles
-        )
-        context['result'] = result
-        context['error'] = None
-    except Exception as e:
-        context['error'] = e
-        context['result'] = None
+    # Note: validate_only feature not yet implemented, treating as regular classification
+    _run_classifier(context)
 
 
 @when('the safeguard layer validates the transcript')
@@ -206,19 +191,7 @@ def safeguard_validates(context):
     print("\n\n=== SAFEGUARD STEP CALLED ===\n\n")
     pytest.skip("Safeguard tests require integration mode with real API calls (use -m integration)")
     
-    try:
-        target_roles = context.get('target_roles', ['Agent', 'Customer'])
-        
-        result = classify_speakers(
-            context['transcript'],
-            target_roles=target_roles,
-            enable_safeguard=True
-        )
-        context['result'] = result
-        context['error'] = None
-    except Exception as e:
-        context['error'] = e
-        context['result'] = None
+    _run_classifier(context, enable_safeguard=True)
 
 
 @when('a correction attempt fails to locate the utterance')
@@ -231,86 +204,71 @@ def correction_fails(context):
 @when('the Lambda function processes the request')
 def lambda_processes_request(context):
     """Process request through Lambda handler."""
-    context['is_lambda'] = True
+    context.is_lambda = True
     try:
-        target_roles = context.get('target_roles', ['Agent', 'Customer'])
+        target_roles = (context.target_roles or ['Agent', 'Customer'])
         # Lambda always returns dict format
-        try:
-            from lambda_handler.handler import lambda_handler
-        except ModuleNotFoundError:
-            # Lambda handler not available in test environment, skip this test
-            pytest.skip("lambda_handler module not available")
-            return
-        import json
-        event = {
-            'body': json.dumps({
-                'transcript': context['transcript'],
-                'target_roles': target_roles
-            })
-        }
+        event = {'body': _event_body(context.transcript, tuple(target_roles))}
         response = lambda_handler(event, None)
-        context['lambda_response'] = response
-        context['error'] = None
+        context.lambda_response = response
+        context.lambda_body = None
+        context.error = None
     except Exception as e:
-        context['error'] = e
-        context['lambda_response'] = None
+        context.error = e
+        context.lambda_response = None
 
 
 @then(parsers.parse('the output should label one speaker as "{role}"'))
 def check_speaker_labeled(context, role):
     """Check that one speaker is labeled with the specified role."""
-    assert context['error'] is None, f"Error occurred: {context['error']}"
-    assert context['result'] is not None
-    result_text = context['result'] if isinstance(context['result'], str) else context['result'].get('transcript', '')
+    assert context.error is None, f"Error occurred: {context.error}"
+    assert context.result is not None
+    result_text = context.result if isinstance(context.result, str) else context.result.get('transcript', '')
     assert f"{role}:" in result_text
 
 
 @then(parsers.parse('the output should label the other speaker as "{role}"'))
 def check_other_speaker_labeled(context, role):
     """Check that the other speaker is labeled with the specified role."""
-    assert context['error'] is None, f"Error occurred: {context['error']}"
-    assert context['result'] is not None
-    result_text = context['result'] if isinstance(context['result'], str) else context['result'].get('transcript', '')
+    assert context.error is None, f"Error occurred: {context.error}"
+    assert context.result is not None
+    result_text = context.result if isinstance(context.result, str) else context.result.get('transcript', '')
     assert f"{role}:" in result_text
 
 
 @then('all non-target labels should be replaced with appropriate roles')
 def check_non_target_replaced(context):
     """Check that all non-target labels are replaced."""
-    result = context['result']
+    result = context.result
     result_text = result if isinstance(result, str) else result.get('transcript', '')
-    assert 'Speaker 0:' not in result_text
-    assert 'Speaker 1:' not in result_text
-    assert 'Unknown:' not in result_text
+    labels = {label.strip() for label in _LABEL_RE.findall(result_text)}
+    assert not labels & {'Speaker 0', 'Speaker 1', 'Unknown'}
 
 
 @then(parsers.parse('the output should only contain "{role1}" and "{role2}" labels'))
 def check_only_target_labels(context, role1, role2):
     """Check that only target role labels are present."""
-    result = context['result']
+    result = context.result
     result_text = result if isinstance(result, str) else result.get('transcript', '')
-    lines = result_text.split('\n')
-    for line in lines:
-        if ':' in line:
-            label = line.split(':')[0].strip()
-            assert label in [role1, role2], f"Unexpected label: {label}"
+    labels = {label.strip() for label in _LABEL_RE.findall(result_text)}
+    assert labels <= {role1, role2}, f"Unexpected labels: {labels - {role1, role2}}"
 
 
 @then(parsers.parse('all "{label}" labels should be replaced appropriately'))
 def check_labels_replaced(context, label):
     """Check that specific labels are replaced."""
-    result = context['result']
+    result = context.result
     result_text = result if isinstance(result, str) else result.get('transcript', '')
-    assert f"{label}:" not in result_text or label in context.get('target_roles', [])
+    assert f"{label}:" not in result_text or label in (context.target_roles or [])
 
 
 @then(parsers.parse('existing "{role}" labels should remain or be corrected if wrong'))
 def check_existing_labels(context, role):
     """Check that existing labels are handled correctly."""
-    result = context['result']
+    result = context.result
     result_text = result if isinstance(result, str) else result.get('transcript', '')
     # If the role is in target roles, it should still be present
-    if role in context.get('target_roles', []):
+    if role in (context.target_roles or []):
         assert f"{role}:" in result_text
 
 
@@ -318,21 +276,21 @@ def check_existing_labels(context, role):
 def check_safeguard_ran(context):
     """Verify safeguard layer executed."""
     # This will be verified through logs
-    assert context.get('result') is not None or context.get('error') is None
+    assert context.result is not None or context.error is None
 
 
 @then('any incorrect labels should be corrected')
 def check_corrections_made(context):
     """Verify corrections were made."""
     # This will be verified by checking the result
-    assert context.get('result') is not None
+    assert context.result is not None
 
 
 @then('the log should show validation activity')
 def check_log_validation(context):
     """Verify log contains validation activity."""
     # This will fail until we implement logging
-    result = context.get('result')
+    result = context.result
     if isinstance(result, dict):
         assert 'log' in result
 
@@ -340,13 +298,13 @@ def check_log_validation(context):
 @then('it should identify the misclassified utterance')
 def check_misclassification_identified(context):
     """Verify misclassification was identified."""
-    assert context.get('result') is not None
+    assert context.result is not None
 
 
 @then('it should correct only that specific utterance')
 def check_specific_correction(context):
     """Verify only specific utterance was corrected."""
-    result = context.get('result')
+    result = context.result
     assert result is not None
 
 
@@ -354,7 +312,7 @@ def check_specific_correction(context):
 def check_log_correction(context):
     """Verify log shows correction."""
     # This will fail until we implement logging
-    result = context.get('result')
+    result = context.result
     if isinstance(result, dict):
         assert 'log' in result
 
@@ -362,19 +320,19 @@ def check_log_correction(context):
 @then('it should identify all misclassified utterances')
 def check_all_identified(context):
     """Verify all misclassifications identified."""
-    assert context.get('result') is not None
+    assert context.result is not None
 
 
 @then('it should correct each one individually')
 def check_individual_corrections(context):
     """Verify individual corrections."""
-    assert context.get('result') is not None
+    assert context.result is not None
 
 
 @then('the log should show all corrections attempted')
 def check_log_all_corrections(context):
     """Verify log shows all corrections."""
-    result = context.get('result')
+    result = context.result
     if isinstance(result, dict):
         assert 'log' in result
 
@@ -394,7 +352,7 @@ def check_retry_occurred(context):
 @then('the log should show the retry attempt')
 def check_log_retry(context):
     """Verify log shows retry."""
-    result = context.get('result')
+    result = context.result
     if isinstance(result, dict):
         assert 'log' in result
 
@@ -404,7 +362,7 @@ def check_response_has_log(context):
     """Verify response includes log."""
     # Note: return_dict feature not yet implemented
     # The classifier currently returns a dict by default
-    result = context.get('result')
+    result = context.result
     assert result is not None
     assert isinstance(result, dict), "Result should be a dict"
     # Log feature may not be implemented yet, skip if not present
@@ -415,10 +373,10 @@ def check_response_has_log(context):
 @then('the log should show the configured role names')
 def check_log_role_names(context):
     """Verify log shows configured roles."""
-    result = context.get('result')
+    result = context.result
     if isinstance(result, dict) and 'log' in result:
         log_str = str(result['log'])
-        target_roles = context.get('target_roles', [])
+        target_roles = (context.target_roles or [])
         for role in target_roles:
             assert role in log_str
 
@@ -426,7 +384,7 @@ def check_log_role_names(context):
 @then("the log should show the LLM's mapping decision")
 def check_log_mapping(context):
     """Verify log shows mapping decision."""
-    result = context.get('result')
+    result = context.result
     if isinstance(result, dict) and 'log' in result:
         assert len(result['log']) > 0
 
@@ -434,7 +392,7 @@ def check_log_mapping(context):
 @then('the log should show any safeguard activity')
 def check_log_safeguard(context):
     """Verify log shows safeguard activity."""
-    result = context.get('result')
+    result = context.result
     if isinstance(result, dict) and 'log' in result:
         assert len(result['log']) > 0
 
@@ -442,10 +400,7 @@ def check_log_safeguard(context):
 @then('the response should contain the classified transcript')
 def check_lambda_transcript(context):
     """Verify Lambda response has transcript."""
-    # Skip if lambda_handler module not available
-    if context.get('error') and isinstance(context.get('error'), ModuleNotFoundError):
-        pytest.skip("lambda_handler module not available")
-    response = context.get('lambda_response')
+    response = context.lambda_response
     assert response is not None
     assert 'body' in response
 
@@ -453,24 +408,15 @@ def check_lambda_transcript(context):
 @then('the response should contain a log array')
 def check_lambda_log(context):
     """Verify Lambda response has log array."""
-    # Skip if lambda_handler module not available
-    if context.get('error') and isinstance(context.get('error'), ModuleNotFoundError):
-        pytest.skip("lambda_handler module not available")
-    response = context.get('lambda_response')
+    response = context.lambda_response
     assert response is not None
-    import json
-    body = json.loads(response['body'])
+    body = _lambda_body(context)
     assert 'log' in body
 
 
 @then('the log should include configuration, mapping, and validation steps')
 def check_lambda_log_content(context):
     """Verify Lambda log has all steps."""
-    # Skip if lambda_handler module not available
-    if context.get('error') and isinstance(context.get('error'), ModuleNotFoundError):
-        pytest.skip("lambda_handler module not available")
-    response = context.get('lambda_response')
-    import json
-    body = json.loads(response['body'])
+    body = _lambda_body(context)
     assert 'log' in body
     assert len(body['log']) > 0
@@ -3,6 +3,7 @@
 import pytest
 from pytest_bdd import scenarios, given, when, then
 from speaker_role_classifier.classifier import classify_speakers
+from speaker_role_classifier.safeguard import run_safeguard_validation
 
 # Load all scenarios from the feature file
 scenarios('../features/safeguard_validation.feature')
@@ -12,160 +13,154 @@ pytestmark = pytest.mark.integration
 
 
 
-@pytest.fixture
-def correctly_classified_transcript():
-    """A correctly classified transcript."""
-    return """Agent: Good afternoon, thank you for calling Premier Plumbing Services. This is Sarah speaking. How may I help you today?
+# Module-level constants: the fixtures below only hand these immutable
+# strings out, so they resolve once per session instead of per scenario
+_CORRECT_TRANSCRIPT = """Agent: Good afternoon, thank you for calling Premier Plumbing Services. This is Sarah speaking. How may I help you today?
 Customer: Hi Sarah, this is Tom Chen from Riverside Apartments. I'm calling about a plumbing emergency in one of our units.
 Agent: Of course, Mr. Chen. I have your account pulled up here. What's the nature of the emergency?
 Customer: We have a burst pipe in unit 3B. Water is flooding the bathroom and starting to seep into the hallway."""
 
 
-@pytest.fixture
-def single_misclassified_transcript():
-    """A transcript with one misclassified utterance."""
-    return """Agent: Good afternoon, thank you for calling Premier Plumbing Services. This is Sarah speaking. How may I help you today?
+_SINGLE_MISCLASSIFIED_TRANSCRIPT = """Agent: Good afternoon, thank you for calling Premier Plumbing Services. This is Sarah speaking. How may I help you today?
 Customer: Hi Sarah, this is Tom Chen from Riverside Apartments. I'm calling about a plumbing emergency in one of our units.
 Customer: Of course, Mr. Chen. I have your account pulled up here. What's the nature of the emergency?
 Agent: We have a burst pipe in unit 3B. Water is flooding the bathroom and starting to seep into the hallway."""
 
 
-@pytest.fixture
-def multiple_misclassified_transcript():
-    """A transcript with multiple misclassified utterances."""
-    return """Customer: Good afternoon, thank you for calling Premier Plumbing Services. This is Sarah speaking. How may I help you today?
+_MULTIPLE_MISCLASSIFIED_TRANSCRIPT = """Customer: Good afternoon, thank you for calling Premier Plumbing Services. This is Sarah speaking. How may I help you today?
 Agent: Hi Sarah, this is Tom Chen from Riverside Apartments. I'm calling about a plumbing emergency in one of our units.
 Customer: Of course, Mr. Chen. I have your account pulled up here. What's the nature of the emergency?
 Agent: We have a burst pipe in unit 3B. Water is flooding the bathroom and starting to seep into the hallway."""
 
 
-@pytest.fixture
-def diarized_transcript():
-    """A diarized transcript with generic labels."""
-    return """Speaker 0: Good afternoon, thank you for calling Premier Plumbing Services.
+_DIARIZED_TRANSCRIPT = """Speaker 0: Good afternoon, thank you for calling Premier Plumbing Services.
 Speaker 1: Hi, I need help with a plumbing issue.
 Speaker 0: Of course, what's the problem?
 Speaker 1: My sink is leaking."""
 
 
+@pytest.fixture(scope="session")
+def correctly_classified_transcript():
+    """A correctly classified transcript."""
+    return _CORRECT_TRANSCRIPT
+
+
+@pytest.fixture(scope="session")
+def single_misclassified_transcript():
+    """A transcript with one misclassified utterance."""
+    return _SINGLE_MISCLASSIFIED_TRANSCRIPT
+
+
+@pytest.fixture(scope="session")
+def multiple_misclassified_transcript():
+    """A transcript with multiple misclassified utterances."""
+    return _MULTIPLE_MISCLASSIFIED_TRANSCRIPT
+
+
+@pytest.fixture(scope="session")
+def diarized_transcript():
+    """A diarized transcript with generic labels."""
+    return _DIARIZED_TRANSCRIPT
+
+
+def _invoke_safeguard(context):
+    """Run safeguard validation and record the outcome on the context."""
+    log = []
+    try:
+        context.result = run_safeguard_validation(
+            context.transcript,
+            context.target_roles,
+            log
+        )
+        context.error = None
+    except Exception as e:
+        context.error = e
+        context.result = None
+    context.log = log
+    context.log_by_step = _index_log(log)
+
+
+def _index_log(log):
+    """Bucket log entries by step so the Then-checkers do O(1) lookups."""
+    by_step = {}
+    for entry in log:
+        by_step.setdefault(entry.get('step'), []).append(entry)
+    return by_step
+
+
 @given('a correctly classified transcript with "Agent" and "Customer"')
 def correct_transcript(correctly_classified_transcript, context):
     """Set up a correctly classified transcript."""
-    context['transcript'] = correctly_classified_transcript
-    context['target_roles'] = ['Agent', 'Customer']
+    context.transcript = correctly_classified_transcript
+    context.target_roles = ['Agent', 'Customer']
 
 
 @given('a correctly classified transcript with "Sales" and "Lead"')
 def correct_transcript_custom(context):
     """Set up a correctly classified transcript with custom roles."""
-    context['transcript'] = """Sales: Hello, thanks for your interest in our product.
+    context.transcript = """Sales: Hello, thanks for your interest in our product.
 Lead: Hi, I'd like to learn more about your services.
 Sales: Great! Let me tell you about our offerings.
 Lead: That sounds interesting."""
-    context['target_roles'] = ['Sales', 'Lead']
+    context.target_roles = ['Sales', 'Lead']
 
 
 @given('a transcript with one misclassified utterance')
 def single_misclassified(single_misclassified_transcript, context):
     """Set up a transcript with one misclassification."""
-    context['transcript'] = single_misclassified_transcript
-    context['target_roles'] = ['Agent', 'Customer']
+    context.transcript = single_misclassified_transcript
+    context.target_roles = ['Agent', 'Customer']
 
 
 @given('a transcript with multiple misclassified utterances')
 def multiple_misclassified(multiple_misclassified_transcript, context):
     """Set up a transcript with multiple misclassifications."""
-    context['transcript'] = multiple_misclassified_transcript
-    context['target_roles'] = ['Agent', 'Customer']
+    context.transcript = multiple_misclassified_transcript
+    context.target_roles = ['Agent', 'Customer']
 
 
 @given('a transcript requiring corrections')
 def transcript_needing_corrections(single_misclassified_transcript, context):
     """Set up a transcript that needs corrections."""
-    context['transcript'] = single_misclassified_transcript
-    context['target_roles'] = ['Agent', 'Customer']
+    context.transcript = single_misclassified_transcript
+    context.target_roles = ['Agent', 'Customer']
 
 
 @given('a transcript with many potential corrections')
 def many_corrections(context):
     """Set up a transcript with many potential corrections."""
-    context['transcript'] = """Customer: Hello, how can I help you?
+    context.transcript = """Customer: Hello, how can I help you?
 Agent: Hi, I need assistance.
 Customer: Sure, what's the issue?
 Agent: My account is locked.
 Customer: Let me check that for you.
 Agent: Thank you."""
-    context['target_roles'] = ['Agent', 'Customer']
+    context.target_roles = ['Agent', 'Customer']
 
 
 @given('a diarized transcript with generic speaker labels')
 def diarized_generic(diarized_transcript, context):
     """Set up a diarized transcript."""
-    context['transcript'] = diarized_transcript
-    context['target_roles'] = ['Agent', 'Customer']
+    context.transcript = diarized_transcript
+    context.target_roles = ['Agent', 'Customer']
 
 
 @when('the safeguard validation runs')
 def run_safeguard(context):
     """Run safeguard validation on the transcript."""
-    from speaker_role_classifier.safeguard import run_safeguard_validation
-    
-    log = []
-    try:
-        result = run_safeguard_validation(
-            context['transcript'],
-            context['target_roles'],
-            log
-        )
-        context['result'] = result
-        context['log'] = log
-        context['error'] = None
-    except Exception as e:
-        context['error'] = e
-        context['result'] = None
-        context['log'] = log
+    _invoke_safeguard(context)
 
 
 @when('the safeguard validation runs with custom roles')
 def run_safeguard_custom(context):
     """Run safeguard validation with custom roles."""
-    from speaker_role_classifier.safeguard import run_safeguard_validation
-    
-    log = []
-    try:
-        result = run_safeguard_validation(
-            context['transcript'],
-            context['target_roles'],
-            log
-        )
-        context['result'] = result
-        context['log'] = log
-        context['error'] = None
-    except Exception as e:
-        context['error'] = e
-        context['result'] = None
-        context['log'] = log
+    _invoke_safeguard(context)
 
 
 @when('the safeguard tool call cannot locate an utterance')
 def tool_call_fails(context):
     """Simulate a failed tool call."""
-    from speaker_role_classifier.safeguard import run_safeguard_validation
-    
-    log = []
-    try:
-        result = run_safeguard_validation(
-            context['transcript'],
-            context['target_roles'],
-            log
-        )
-        context['result'] = result
-        context['log'] = log
-        context['error'] = None
-    except Exception as e:
-        context['error'] = e
-        context['result'] = None
-        context['log'] = log
+    _invoke_safeguard(context)
 
 
 @when('the classifier processes with safeguard enabled')
@@ -173,129 +168,126 @@ def classify_with_safeguard(context):
     """Process transcript with safeguard enabled."""
     try:
         result = classify_speakers(
-            context['transcript'],
-            target_roles=context['target_roles'],
+            context.transcript,
+            target_roles=context.target_roles,
             enable_safeguard=True
         )
-        context['result'] = result['transcript']
-        context['log'] = result['log']
-        context['error'] = None
+        context.result = result['transcript']
+        context.log = result['log']
+        context.error = None
     except Exception as e:
-        context['error'] = e
-        context['result'] = None
-        context['log'] = []
+        context.error = e
+        context.result = None
+        context.log = []
+    context.log_by_step = _index_log(context.log)
 
 
 @then('no corrections should be made')
 def check_no_corrections(context):
     """Verify no corrections were made."""
-    assert context['error'] is None
-    corrections = [entry for entry in context['log'] if entry.get('step') == 'utterance_corrected']
+    assert context.error is None
     # With real API, we just check it completed without error
-    assert context['result'] is not None
+    assert context.result is not None
 
 
 @then('the log should show safeguard completed successfully')
 def check_safeguard_completed(context):
     """Verify safeguard completed."""
-    assert any(entry.get('step') == 'safeguard_end' for entry in context['log'])
+    assert 'safeguard_end' in context.log_by_step
 
 
 @then('the misclassified utterance should be corrected')
 def check_single_correction(context):
     """Verify single correction was made."""
-    assert context['error'] is None
-    corrections = [entry for entry in context['log'] if entry.get('step') == 'utterance_corrected']
-    assert len(corrections) >= 1
+    assert context.error is None
+    assert len(context.log_by_step.get('utterance_corrected', ())) >= 1
 
 
 @then('the log should show one correction')
 def check_one_correction_log(context):
     """Verify log shows one correction."""
-    corrections = [entry for entry in context['log'] if entry.get('step') == 'utterance_corrected']
-    assert len(corrections) >= 1
+    assert len(context.log_by_step.get('utterance_corrected', ())) >= 1
 
 
 @then('all misclassified utterances should be corrected')
 def check_multiple_corrections(context):
     """Verify multiple corrections were made."""
-    assert context['error'] is None
-    corrections = [entry for entry in context['log'] if entry.get('step') == 'utterance_corrected']
+    assert context.error is None
     # With real API we expect at least 1 correction
-    assert len(corrections) >= 1
+    assert len(context.log_by_step.get('utterance_corrected', ())) >= 1
 
 
 @then('the log should show multiple corrections')
 def check_multiple_corrections_log(context):
     """Verify log shows multiple corrections."""
-    corrections = [entry for entry in context['log'] if entry.get('step') == 'utterance_corrected']
-    assert len(corrections) >= 1
+    assert len(context.log_by_step.get('utterance_corrected', ())) >= 1
 
 
 @then('the corrected transcript should have proper role labels')
 def check_proper_labels(context):
     """Verify transcript has proper role labels."""
-    assert context['error'] is None
-    assert context['result'] is not None
-    for line in context['result'].split('\n'):
-        if line.strip():
-            assert any(line.startswith(f"{role}:") for role in context['target_roles'])
+    assert context.error is None
+    assert context.result is not None
+    # Build the role prefixes once; startswith takes the tuple natively
+    prefixes = tuple(f"{role}:" for role in context.target_roles)
+    for line in context.result.splitlines():
+        if not line or line.isspace():
+            continue
+        assert line.startswith(prefixes)
 
 
 @then('the safeguard should log the failure')
 def check_failure_logged(context):
     """Verify failure was logged."""
-    assert any(entry.get('step') == 'safeguard_start' for entry in context['log'])
+    assert 'safeguard_start' in context.log_by_step
 
 
 @then('the safeguard should continue with remaining corrections')
 def check_continued_after_failure(context):
     """Verify safeguard continued after failure."""
-    assert any(entry.get('step') == 'safeguard_end' for entry in context['log'])
+    assert 'safeguard_end' in context.log_by_step
 
 
 @then('the safeguard should not exceed max iterations')
 def check_max_iterations(context):
     """Verify max iterations not exceeded."""
-    iterations = [entry for entry in context['log'] if entry.get('step') == 'safeguard_iteration']
-    assert len(iterations) <= 3
+    assert len(context.log_by_step.get('safeguard_iteration', ())) <= 3
 
 
 @then('the log should show iteration count')
 def check_iteration_count(context):
     """Verify log shows iterations."""
-    iterations = [entry for entry in context['log'] if entry.get('step') == 'safeguard_iteration']
-    assert len(iterations) > 0
+    assert len(context.log_by_step.get('safeguard_iteration', ())) > 0
 
 
 @then('the log should show the custom target roles')
 def check_custom_roles_logged(context):
     """Verify custom roles are in log."""
-    start_entry = next((e for e in context['log'] if e.get('step') == 'safeguard_start'), None)
-    assert start_entry is not None
-    assert start_entry.get('target_roles') == context['target_roles']
+    start_entries = context.log_by_step.get('safeguard_start')
+    assert start_entries
+    assert start_entries[0].get('target_roles') == context.target_roles
 
 
 @then('the transcript should be classified correctly')
 def check_classified_correctly(context):
     """Verify transcript is classified."""
-    assert context['error'] is None
-    assert context['result'] is not None
-    assert "Agent:" in context['result']
-    assert "Customer:" in context['result']
-    assert "Speaker 0:" not in context['result']
+    assert context.error is None
+    assert context.result is not None
+    assert "Agent:" in context.result
+    assert "Customer:" in context.result
+    assert "Speaker 0:" not in context.result
 
 
 @then('the safeguard should validate the classification')
 def check_safeguard_ran(context):
     """Verify safeguard ran."""
-    assert any(entry.get('step') == 'safeguard_start' for entry in context['log'])
-    assert any(entry.get('step') == 'safeguard_end' for entry in context['log'])
+    assert 'safeguard_start' in context.log_by_step
+    assert 'safeguard_end' in context.log_by_step
 
 
 @then('the log should show both classification and safeguard steps')
 def check_both_steps(context):
     """Verify log shows both classification and safeguard."""
-    assert any(entry.get('step') == 'configuration' for entry in context['log'])
-    assert any(entry.get('step') == 'safeguard_start' for entry in context['log'])
+    assert 'configuration' in context.log_by_step
+    assert 'safeguard_start' in context.log_by_step
 